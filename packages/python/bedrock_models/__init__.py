@@ -1,4 +1,4 @@
-from .bedrock_model_ids import Models, MantleModels, RuntimeModels
+from .bedrock_model_ids import Models, MantleModels, RuntimeModels, clear_caches
 from .utils import (
     is_model_available,
     get_available_regions,
@@ -7,6 +7,7 @@ from .utils import (
     get_inference_types,
     cris_model_id,
     global_model_id,
+    resolve_endpoint,
 )
 
 __all__ = [
@@ -20,4 +21,6 @@ __all__ = [
     "get_inference_types",
     "cris_model_id",
     "global_model_id",
+    "resolve_endpoint",
+    "clear_caches",
 ]
\ No newline at end of file
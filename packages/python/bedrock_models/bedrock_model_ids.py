@@ -2,342 +2,477 @@
 Auto-generated class containing AWS Bedrock Foundation Model IDs.
 """
 
-import warnings
-from .utils import cris_model_id, global_model_id
+import functools
+import sys
+from typing import Optional
+from . import utils
+from .utils import cris_model_id, get_available_regions, global_model_id, resolve_endpoint
 
 
+@functools.lru_cache(maxsize=4096)
+def _cris_cached(model_id: str, region: str) -> str:
+    return cris_model_id(model_id, region)
+
+
+@functools.lru_cache(maxsize=4096)
+def _global_cris_cached(model_id: str, region: str) -> str:
+    return global_model_id(model_id, region)
+
+
+@functools.lru_cache(maxsize=4096)
+def _regions_cached(model_id: str) -> tuple[str, ...]:
+    return tuple(sorted(get_available_regions(model_id)))
+
+
+def clear_caches() -> None:
+    """Clear the memoized model data and CRIS, global inference profile and region lookups."""
+    utils.clear_caches()
+    _cris_cached.cache_clear()
+    _global_cris_cached.cache_clear()
+    _regions_cached.cache_clear()
+
+
+_DEPRECATED_MESSAGE = (
+    "Model '{model_id}' has LEGACY status and may be removed by AWS. "
+    "Consider migrating to a newer model."
+)
+
 class BedrockModel(str):
     """Specialized string type that adds Bedrock-specific methods."""
 
-    def cris(self, region: str = None) -> str:
+    # _sid holds the interned plain-str form of the ID, so lookups in the
+    # model data dicts take the exact-str fast path.
+    __slots__ = ("_sid",)
+    _intern: dict[str, "BedrockModel"] = {}
+
+    def __new__(cls, value: str) -> "BedrockModel":
+        model = cls._intern.get(value)
+        if model is not None:
+            return model
+        sid = sys.intern(str(value))
+        model = super().__new__(cls, sid)
+        model._sid = sid
+        cls._intern[sid] = model
+        return model
+
+    def __reduce__(self) -> tuple:
+        return (BedrockModel, (self._sid,))
+
+    def cris(self, region: Optional[str] = None) -> str:
         """Get the cross-region inference (CRIS) model ID for this model."""
-        return cris_model_id(str(self), region)
+        if region is None:
+            return cris_model_id(self._sid, region)
+        return _cris_cached(self._sid, region)
 
-    def global_cris(self, region: str = None) -> str:
+    def global_cris(self, region: Optional[str] = None) -> str:
         """Get the global inference profile ID for this model."""
-        return global_model_id(str(self), region)
+        if region is None:
+            return global_model_id(self._sid, region)
+        return _global_cris_cached(self._sid, region)
+
+    def resolve(self, region: Optional[str] = None, prefer_global: bool = False) -> tuple[str, str]:
+        """Resolve the best endpoint ID and its kind for this model in a region."""
+        return resolve_endpoint(self._sid, region, prefer_global)
+
+    @property
+    def available_regions(self) -> tuple[str, ...]:
+        """Sorted regions where this model is available, computed once per model."""
+        return _regions_cached(self._sid)
+
+
+def _deprecated_model(model_id: str) -> BedrockModel:
+    """Warn that a LEGACY model was accessed, then return it."""
+    import warnings
 
+    # stacklevel=3 skips this helper and the __getattr__ calling it
+    message = _DEPRECATED_MESSAGE.format(model_id=model_id)
+    warnings.warn(message, DeprecationWarning, stacklevel=3)
+    return BedrockModel(model_id)
 
-class _DeprecatedModelDescriptor:
-    """Descriptor that emits deprecation warning when accessed."""
-    def __init__(self, model_id: str, message: str):
-        self.model_id = BedrockModel(model_id)
-        self.message = message
-    def __get__(self, obj, objtype=None):
-        warnings.warn(self.message, DeprecationWarning, stacklevel=2)
-        return self.model_id
-    def __set_name__(self, owner, name):
-        self.name = name
 
+class _ModelsMeta(type):
+    """
+    Metaclass building the model constants of a class from its _TABLE string.
 
-class Models:
+    Each whitespace-separated row is NAME=model_id; a leading "!" marks a LEGACY model.
+
+    Constants are built by __getattr__ on first access. Active ones are then
+    stored on the class, so later reads are plain attribute loads; deprecated
+    ones are never stored and emit a DeprecationWarning on every access
+    (shown once per location under the default warnings filters).
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        index = {}
+        deprecated = {}
+        for row in namespace.pop("_TABLE", "").split():
+            field, _, model_id = row.lstrip("!").partition("=")
+            index[field] = model_id
+            if row[0] == "!":
+                deprecated[field] = model_id
+        namespace["_INDEX"] = index
+        namespace["_DEPRECATED"] = deprecated
+        namespace["_DEPRECATED_IDS"] = frozenset(deprecated.values())
+        return super().__new__(mcs, name, bases, namespace)
+
+    def __getattr__(cls, name):
+        model_id = cls._DEPRECATED.get(name)
+        if model_id is not None:
+            return _deprecated_model(model_id)
+        model_id = cls._INDEX.get(name)
+        if model_id is None:
+            raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}")
+        model = BedrockModel(model_id)
+        type.__setattr__(cls, name, model)
+        return model
+
+    def __iter__(cls):
+        return iter(cls._INDEX)
+
+    def __dir__(cls):
+        return sorted(set(super().__dir__()) | set(cls._INDEX))
+
+    def is_deprecated(cls, model_id: str) -> bool:
+        """Check whether a model ID has LEGACY status, without triggering a warning."""
+        return model_id in cls._DEPRECATED_IDS
+
+    def as_str(cls, model: str) -> str:
+        """Return a model ID as a plain str, for code that requires exactly str."""
+        if isinstance(model, BedrockModel):
+            return model._sid
+        return str.__str__(model)
+
+
+class Models(metaclass=_ModelsMeta):
     """Static class containing Bedrock foundation model IDs as constants for Models."""
 
-    AMAZON_NOVA_2_LITE = BedrockModel("amazon.nova-2-lite-v1:0")
-    AMAZON_NOVA_2_MULTIMODAL_EMBEDDINGS = BedrockModel("amazon.nova-2-multimodal-embeddings-v1:0")
-    AMAZON_NOVA_2_SONIC = BedrockModel("amazon.nova-2-sonic-v1:0")
-    AMAZON_NOVA_LITE = BedrockModel("amazon.nova-lite-v1:0")
-    AMAZON_NOVA_MICRO = BedrockModel("amazon.nova-micro-v1:0")
-    AMAZON_NOVA_PRO = BedrockModel("amazon.nova-pro-v1:0")
-    AMAZON_RERANK = BedrockModel("amazon.rerank-v1:0")
-    AMAZON_TITAN_EMBED_G1_TEXT_02 = BedrockModel("amazon.titan-embed-g1-text-02")
-    AMAZON_TITAN_EMBED_IMAGE = BedrockModel("amazon.titan-embed-image-v1")
-    AMAZON_TITAN_EMBED_TEXT = BedrockModel("amazon.titan-embed-text-v2:0")
-    ANTHROPIC_CLAUDE_3_5_SONNET_20240620 = BedrockModel("anthropic.claude-3-5-sonnet-20240620-v1:0")
-    ANTHROPIC_CLAUDE_3_5_SONNET_20241022 = BedrockModel("anthropic.claude-3-5-sonnet-20241022-v2:0")
-    ANTHROPIC_CLAUDE_3_7_SONNET_20250219 = BedrockModel("anthropic.claude-3-7-sonnet-20250219-v1:0")
-    ANTHROPIC_CLAUDE_3_SONNET_20240229 = BedrockModel("anthropic.claude-3-sonnet-20240229-v1:0")
-    ANTHROPIC_CLAUDE_FABLE_5 = BedrockModel("anthropic.claude-fable-5")
-    ANTHROPIC_CLAUDE_HAIKU_4_5 = BedrockModel("anthropic.claude-haiku-4-5")
-    ANTHROPIC_CLAUDE_HAIKU_4_5_20251001 = BedrockModel("anthropic.claude-haiku-4-5-20251001-v1:0")
-    ANTHROPIC_CLAUDE_OPUS_4_5_20251101 = BedrockModel("anthropic.claude-opus-4-5-20251101-v1:0")
-    ANTHROPIC_CLAUDE_OPUS_4_6 = BedrockModel("anthropic.claude-opus-4-6-v1")
-    ANTHROPIC_CLAUDE_OPUS_4_7 = BedrockModel("anthropic.claude-opus-4-7")
-    ANTHROPIC_CLAUDE_OPUS_4_8 = BedrockModel("anthropic.claude-opus-4-8")
-    ANTHROPIC_CLAUDE_OPUS_5 = BedrockModel("anthropic.claude-opus-5")
-    ANTHROPIC_CLAUDE_SONNET_4_5_20250929 = BedrockModel("anthropic.claude-sonnet-4-5-20250929-v1:0")
-    ANTHROPIC_CLAUDE_SONNET_4_6 = BedrockModel("anthropic.claude-sonnet-4-6")
-    ANTHROPIC_CLAUDE_SONNET_5 = BedrockModel("anthropic.claude-sonnet-5")
-    COHERE_EMBED = BedrockModel("cohere.embed-v4:0")
-    COHERE_EMBED_ENGLISH = BedrockModel("cohere.embed-english-v3")
-    COHERE_EMBED_MULTILINGUAL = BedrockModel("cohere.embed-multilingual-v3")
-    COHERE_RERANK = BedrockModel("cohere.rerank-v3-5:0")
-    DEEPSEEK_R1 = BedrockModel("deepseek.r1-v1:0")
-    DEEPSEEK_V3 = BedrockModel("deepseek.v3-v1:0")
-    DEEPSEEK_V3_1 = BedrockModel("deepseek.v3.1")
-    DEEPSEEK_V3_2 = BedrockModel("deepseek.v3.2")
-    GOOGLE_GEMMA_3_12B_IT = BedrockModel("google.gemma-3-12b-it")
-    GOOGLE_GEMMA_3_27B_IT = BedrockModel("google.gemma-3-27b-it")
-    GOOGLE_GEMMA_3_4B_IT = BedrockModel("google.gemma-3-4b-it")
-    GOOGLE_GEMMA_4_26B_A4B = BedrockModel("google.gemma-4-26b-a4b")
-    GOOGLE_GEMMA_4_31B = BedrockModel("google.gemma-4-31b")
-    GOOGLE_GEMMA_4_E2B = BedrockModel("google.gemma-4-e2b")
-    LUMA_RAY = BedrockModel("luma.ray-v2:0")
-    META_LLAMA3_1_70B_INSTRUCT = BedrockModel("meta.llama3-1-70b-instruct-v1:0")
-    META_LLAMA3_1_8B_INSTRUCT = BedrockModel("meta.llama3-1-8b-instruct-v1:0")
-    META_LLAMA3_3_70B_INSTRUCT = BedrockModel("meta.llama3-3-70b-instruct-v1:0")
-    META_LLAMA3_70B_INSTRUCT = BedrockModel("meta.llama3-70b-instruct-v1:0")
-    META_LLAMA3_8B_INSTRUCT = BedrockModel("meta.llama3-8b-instruct-v1:0")
-    META_LLAMA4_MAVERICK_17B_INSTRUCT = BedrockModel("meta.llama4-maverick-17b-instruct-v1:0")
-    META_LLAMA4_SCOUT_17B_INSTRUCT = BedrockModel("meta.llama4-scout-17b-instruct-v1:0")
-    MINIMAX_MINIMAX_M2 = BedrockModel("minimax.minimax-m2")
-    MINIMAX_MINIMAX_M2_1 = BedrockModel("minimax.minimax-m2.1")
-    MINIMAX_MINIMAX_M2_5 = BedrockModel("minimax.minimax-m2.5")
-    MISTRAL_DEVSTRAL_2_123B = BedrockModel("mistral.devstral-2-123b")
-    MISTRAL_MAGISTRAL_SMALL_2509 = BedrockModel("mistral.magistral-small-2509")
-    MISTRAL_MINISTRAL_3_14B_INSTRUCT = BedrockModel("mistral.ministral-3-14b-instruct")
-    MISTRAL_MINISTRAL_3_3B_INSTRUCT = BedrockModel("mistral.ministral-3-3b-instruct")
-    MISTRAL_MINISTRAL_3_8B_INSTRUCT = BedrockModel("mistral.ministral-3-8b-instruct")
-    MISTRAL_MISTRAL_7B_INSTRUCT = BedrockModel("mistral.mistral-7b-instruct-v0:2")
-    MISTRAL_MISTRAL_LARGE_2402 = BedrockModel("mistral.mistral-large-2402-v1:0")
-    MISTRAL_MISTRAL_LARGE_2407 = BedrockModel("mistral.mistral-large-2407-v1:0")
-    MISTRAL_MISTRAL_LARGE_3_675B_INSTRUCT = BedrockModel("mistral.mistral-large-3-675b-instruct")
-    MISTRAL_MISTRAL_SMALL_2402 = BedrockModel("mistral.mistral-small-2402-v1:0")
-    MISTRAL_MIXTRAL_8X7B_INSTRUCT = BedrockModel("mistral.mixtral-8x7b-instruct-v0:1")
-    MISTRAL_PIXTRAL_LARGE_2502 = BedrockModel("mistral.pixtral-large-2502-v1:0")
-    MISTRAL_VOXTRAL_MINI_3B_2507 = BedrockModel("mistral.voxtral-mini-3b-2507")
-    MISTRAL_VOXTRAL_SMALL_24B_2507 = BedrockModel("mistral.voxtral-small-24b-2507")
-    MOONSHOTAI_KIMI_K2_5 = BedrockModel("moonshotai.kimi-k2.5")
-    MOONSHOTAI_KIMI_K2_THINKING = BedrockModel("moonshotai.kimi-k2-thinking")
-    MOONSHOT_KIMI_K2_THINKING = BedrockModel("moonshot.kimi-k2-thinking")
-    NVIDIA_NEMOTRON_NANO_12B = BedrockModel("nvidia.nemotron-nano-12b-v2")
-    NVIDIA_NEMOTRON_NANO_3_30B = BedrockModel("nvidia.nemotron-nano-3-30b")
-    NVIDIA_NEMOTRON_NANO_9B = BedrockModel("nvidia.nemotron-nano-9b-v2")
-    NVIDIA_NEMOTRON_SUPER_3_120B = BedrockModel("nvidia.nemotron-super-3-120b")
-    OPENAI_GPT_5_4 = BedrockModel("openai.gpt-5.4")
-    OPENAI_GPT_5_4_2026_03_05 = BedrockModel("openai.gpt-5.4-2026-03-05")
-    OPENAI_GPT_5_5 = BedrockModel("openai.gpt-5.5")
-    OPENAI_GPT_5_5_2026_04_23 = BedrockModel("openai.gpt-5.5-2026-04-23")
-    OPENAI_GPT_5_6_LUNA = BedrockModel("openai.gpt-5.6-luna")
-    OPENAI_GPT_5_6_SOL = BedrockModel("openai.gpt-5.6-sol")
-    OPENAI_GPT_5_6_TERRA = BedrockModel("openai.gpt-5.6-terra")
-    OPENAI_GPT_OSS_120B = BedrockModel("openai.gpt-oss-120b-1:0")
-    OPENAI_GPT_OSS_20B = BedrockModel("openai.gpt-oss-20b-1:0")
-    OPENAI_GPT_OSS_SAFEGUARD_120B = BedrockModel("openai.gpt-oss-safeguard-120b")
-    OPENAI_GPT_OSS_SAFEGUARD_20B = BedrockModel("openai.gpt-oss-safeguard-20b")
-    QWEN_QWEN3_235B_A22B_2507 = BedrockModel("qwen.qwen3-235b-a22b-2507-v1:0")
-    QWEN_QWEN3_32B = BedrockModel("qwen.qwen3-32b-v1:0")
-    QWEN_QWEN3_CODER_30B_A3B = BedrockModel("qwen.qwen3-coder-30b-a3b-v1:0")
-    QWEN_QWEN3_CODER_30B_A3B_INSTRUCT = BedrockModel("qwen.qwen3-coder-30b-a3b-instruct")
-    QWEN_QWEN3_CODER_480B_A35B = BedrockModel("qwen.qwen3-coder-480b-a35b-v1:0")
-    QWEN_QWEN3_CODER_480B_A35B_INSTRUCT = BedrockModel("qwen.qwen3-coder-480b-a35b-instruct")
-    QWEN_QWEN3_CODER_NEXT = BedrockModel("qwen.qwen3-coder-next")
-    QWEN_QWEN3_NEXT_80B_A3B = BedrockModel("qwen.qwen3-next-80b-a3b")
-    QWEN_QWEN3_NEXT_80B_A3B_INSTRUCT = BedrockModel("qwen.qwen3-next-80b-a3b-instruct")
-    QWEN_QWEN3_VL_235B_A22B = BedrockModel("qwen.qwen3-vl-235b-a22b")
-    QWEN_QWEN3_VL_235B_A22B_INSTRUCT = BedrockModel("qwen.qwen3-vl-235b-a22b-instruct")
-    STABILITY_SD3_5_LARGE = BedrockModel("stability.sd3-5-large-v1:0")
-    STABILITY_STABLE_CONSERVATIVE_UPSCALE = BedrockModel("stability.stable-conservative-upscale-v1:0")
-    STABILITY_STABLE_CREATIVE_UPSCALE = BedrockModel("stability.stable-creative-upscale-v1:0")
-    STABILITY_STABLE_FAST_UPSCALE = BedrockModel("stability.stable-fast-upscale-v1:0")
-    STABILITY_STABLE_IMAGE_CONTROL_SKETCH = BedrockModel("stability.stable-image-control-sketch-v1:0")
-    STABILITY_STABLE_IMAGE_CONTROL_STRUCTURE = BedrockModel("stability.stable-image-control-structure-v1:0")
-    STABILITY_STABLE_IMAGE_CORE = BedrockModel("stability.stable-image-core-v1:1")
-    STABILITY_STABLE_IMAGE_ERASE_OBJECT = BedrockModel("stability.stable-image-erase-object-v1:0")
-    STABILITY_STABLE_IMAGE_INPAINT = BedrockModel("stability.stable-image-inpaint-v1:0")
-    STABILITY_STABLE_IMAGE_REMOVE_BACKGROUND = BedrockModel("stability.stable-image-remove-background-v1:0")
-    STABILITY_STABLE_IMAGE_SEARCH_RECOLOR = BedrockModel("stability.stable-image-search-recolor-v1:0")
-    STABILITY_STABLE_IMAGE_SEARCH_REPLACE = BedrockModel("stability.stable-image-search-replace-v1:0")
-    STABILITY_STABLE_IMAGE_STYLE_GUIDE = BedrockModel("stability.stable-image-style-guide-v1:0")
-    STABILITY_STABLE_IMAGE_ULTRA = BedrockModel("stability.stable-image-ultra-v1:1")
-    STABILITY_STABLE_OUTPAINT = BedrockModel("stability.stable-outpaint-v1:0")
-    STABILITY_STABLE_STYLE_TRANSFER = BedrockModel("stability.stable-style-transfer-v1:0")
-    TWELVELABS_MARENGO_EMBED_3_0 = BedrockModel("twelvelabs.marengo-embed-3-0-v1:0")
-    TWELVELABS_PEGASUS_1_2 = BedrockModel("twelvelabs.pegasus-1-2-v1:0")
-    WRITER_PALMYRA_VISION_7B = BedrockModel("writer.palmyra-vision-7b")
-    WRITER_PALMYRA_X4 = BedrockModel("writer.palmyra-x4-v1:0")
-    WRITER_PALMYRA_X5 = BedrockModel("writer.palmyra-x5-v1:0")
-    XAI_GROK_4_3 = BedrockModel("xai.grok-4.3")
-    ZAI_GLM_4_6 = BedrockModel("zai.glm-4.6")
-    ZAI_GLM_4_7 = BedrockModel("zai.glm-4.7")
-    ZAI_GLM_4_7_FLASH = BedrockModel("zai.glm-4.7-flash")
-    ZAI_GLM_5 = BedrockModel("zai.glm-5")
-    AI21_JAMBA_1_5_LARGE = _DeprecatedModelDescriptor("ai21.jamba-1-5-large-v1:0", "Model 'ai21.jamba-1-5-large-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    AI21_JAMBA_1_5_MINI = _DeprecatedModelDescriptor("ai21.jamba-1-5-mini-v1:0", "Model 'ai21.jamba-1-5-mini-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    AMAZON_NOVA_CANVAS = _DeprecatedModelDescriptor("amazon.nova-canvas-v1:0", "Model 'amazon.nova-canvas-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    AMAZON_NOVA_PREMIER = _DeprecatedModelDescriptor("amazon.nova-premier-v1:0", "Model 'amazon.nova-premier-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    AMAZON_NOVA_REEL = _DeprecatedModelDescriptor("amazon.nova-reel-v1:1", "Model 'amazon.nova-reel-v1:1' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    AMAZON_NOVA_SONIC = _DeprecatedModelDescriptor("amazon.nova-sonic-v1:0", "Model 'amazon.nova-sonic-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    ANTHROPIC_CLAUDE_3_HAIKU_20240307 = _DeprecatedModelDescriptor("anthropic.claude-3-haiku-20240307-v1:0", "Model 'anthropic.claude-3-haiku-20240307-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    ANTHROPIC_CLAUDE_OPUS_4_1_20250805 = _DeprecatedModelDescriptor("anthropic.claude-opus-4-1-20250805-v1:0", "Model 'anthropic.claude-opus-4-1-20250805-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    ANTHROPIC_CLAUDE_SONNET_4_20250514 = _DeprecatedModelDescriptor("anthropic.claude-sonnet-4-20250514-v1:0", "Model 'anthropic.claude-sonnet-4-20250514-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    COHERE_COMMAND_R = _DeprecatedModelDescriptor("cohere.command-r-v1:0", "Model 'cohere.command-r-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    COHERE_COMMAND_R_PLUS = _DeprecatedModelDescriptor("cohere.command-r-plus-v1:0", "Model 'cohere.command-r-plus-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    TWELVELABS_MARENGO_EMBED_2_7 = _DeprecatedModelDescriptor("twelvelabs.marengo-embed-2-7-v1:0", "Model 'twelvelabs.marengo-embed-2-7-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-
-
-class MantleModels:
+    _TABLE = """
+        AMAZON_NOVA_2_LITE=amazon.nova-2-lite-v1:0
+        AMAZON_NOVA_2_MULTIMODAL_EMBEDDINGS=amazon.nova-2-multimodal-embeddings-v1:0
+        AMAZON_NOVA_2_SONIC=amazon.nova-2-sonic-v1:0
+        AMAZON_NOVA_LITE=amazon.nova-lite-v1:0
+        AMAZON_NOVA_MICRO=amazon.nova-micro-v1:0
+        AMAZON_NOVA_PRO=amazon.nova-pro-v1:0
+        AMAZON_RERANK=amazon.rerank-v1:0
+        AMAZON_TITAN_EMBED_G1_TEXT_02=amazon.titan-embed-g1-text-02
+        AMAZON_TITAN_EMBED_IMAGE=amazon.titan-embed-image-v1
+        AMAZON_TITAN_EMBED_TEXT=amazon.titan-embed-text-v2:0
+        ANTHROPIC_CLAUDE_3_5_SONNET_20240620=anthropic.claude-3-5-sonnet-20240620-v1:0
+        ANTHROPIC_CLAUDE_3_5_SONNET_20241022=anthropic.claude-3-5-sonnet-20241022-v2:0
+        ANTHROPIC_CLAUDE_3_7_SONNET_20250219=anthropic.claude-3-7-sonnet-20250219-v1:0
+        ANTHROPIC_CLAUDE_3_SONNET_20240229=anthropic.claude-3-sonnet-20240229-v1:0
+        ANTHROPIC_CLAUDE_FABLE_5=anthropic.claude-fable-5
+        ANTHROPIC_CLAUDE_HAIKU_4_5=anthropic.claude-haiku-4-5
+        ANTHROPIC_CLAUDE_HAIKU_4_5_20251001=anthropic.claude-haiku-4-5-20251001-v1:0
+        ANTHROPIC_CLAUDE_OPUS_4_5_20251101=anthropic.claude-opus-4-5-20251101-v1:0
+        ANTHROPIC_CLAUDE_OPUS_4_6=anthropic.claude-opus-4-6-v1
+        ANTHROPIC_CLAUDE_OPUS_4_7=anthropic.claude-opus-4-7
+        ANTHROPIC_CLAUDE_OPUS_4_8=anthropic.claude-opus-4-8
+        ANTHROPIC_CLAUDE_OPUS_5=anthropic.claude-opus-5
+        ANTHROPIC_CLAUDE_SONNET_4_5_20250929=anthropic.claude-sonnet-4-5-20250929-v1:0
+        ANTHROPIC_CLAUDE_SONNET_4_6=anthropic.claude-sonnet-4-6
+        ANTHROPIC_CLAUDE_SONNET_5=anthropic.claude-sonnet-5
+        COHERE_EMBED=cohere.embed-v4:0
+        COHERE_EMBED_ENGLISH=cohere.embed-english-v3
+        COHERE_EMBED_MULTILINGUAL=cohere.embed-multilingual-v3
+        COHERE_RERANK=cohere.rerank-v3-5:0
+        DEEPSEEK_R1=deepseek.r1-v1:0
+        DEEPSEEK_V3=deepseek.v3-v1:0
+        DEEPSEEK_V3_1=deepseek.v3.1
+        DEEPSEEK_V3_2=deepseek.v3.2
+        GOOGLE_GEMMA_3_12B_IT=google.gemma-3-12b-it
+        GOOGLE_GEMMA_3_27B_IT=google.gemma-3-27b-it
+        GOOGLE_GEMMA_3_4B_IT=google.gemma-3-4b-it
+        GOOGLE_GEMMA_4_26B_A4B=google.gemma-4-26b-a4b
+        GOOGLE_GEMMA_4_31B=google.gemma-4-31b
+        GOOGLE_GEMMA_4_E2B=google.gemma-4-e2b
+        LUMA_RAY=luma.ray-v2:0
+        META_LLAMA3_1_70B_INSTRUCT=meta.llama3-1-70b-instruct-v1:0
+        META_LLAMA3_1_8B_INSTRUCT=meta.llama3-1-8b-instruct-v1:0
+        META_LLAMA3_3_70B_INSTRUCT=meta.llama3-3-70b-instruct-v1:0
+        META_LLAMA3_70B_INSTRUCT=meta.llama3-70b-instruct-v1:0
+        META_LLAMA3_8B_INSTRUCT=meta.llama3-8b-instruct-v1:0
+        META_LLAMA4_MAVERICK_17B_INSTRUCT=meta.llama4-maverick-17b-instruct-v1:0
+        META_LLAMA4_SCOUT_17B_INSTRUCT=meta.llama4-scout-17b-instruct-v1:0
+        MINIMAX_MINIMAX_M2=minimax.minimax-m2
+        MINIMAX_MINIMAX_M2_1=minimax.minimax-m2.1
+        MINIMAX_MINIMAX_M2_5=minimax.minimax-m2.5
+        MISTRAL_DEVSTRAL_2_123B=mistral.devstral-2-123b
+        MISTRAL_MAGISTRAL_SMALL_2509=mistral.magistral-small-2509
+        MISTRAL_MINISTRAL_3_14B_INSTRUCT=mistral.ministral-3-14b-instruct
+        MISTRAL_MINISTRAL_3_3B_INSTRUCT=mistral.ministral-3-3b-instruct
+        MISTRAL_MINISTRAL_3_8B_INSTRUCT=mistral.ministral-3-8b-instruct
+        MISTRAL_MISTRAL_7B_INSTRUCT=mistral.mistral-7b-instruct-v0:2
+        MISTRAL_MISTRAL_LARGE_2402=mistral.mistral-large-2402-v1:0
+        MISTRAL_MISTRAL_LARGE_2407=mistral.mistral-large-2407-v1:0
+        MISTRAL_MISTRAL_LARGE_3_675B_INSTRUCT=mistral.mistral-large-3-675b-instruct
+        MISTRAL_MISTRAL_SMALL_2402=mistral.mistral-small-2402-v1:0
+        MISTRAL_MIXTRAL_8X7B_INSTRUCT=mistral.mixtral-8x7b-instruct-v0:1
+        MISTRAL_PIXTRAL_LARGE_2502=mistral.pixtral-large-2502-v1:0
+        MISTRAL_VOXTRAL_MINI_3B_2507=mistral.voxtral-mini-3b-2507
+        MISTRAL_VOXTRAL_SMALL_24B_2507=mistral.voxtral-small-24b-2507
+        MOONSHOTAI_KIMI_K2_5=moonshotai.kimi-k2.5
+        MOONSHOTAI_KIMI_K2_THINKING=moonshotai.kimi-k2-thinking
+        MOONSHOT_KIMI_K2_THINKING=moonshot.kimi-k2-thinking
+        NVIDIA_NEMOTRON_NANO_12B=nvidia.nemotron-nano-12b-v2
+        NVIDIA_NEMOTRON_NANO_3_30B=nvidia.nemotron-nano-3-30b
+        NVIDIA_NEMOTRON_NANO_9B=nvidia.nemotron-nano-9b-v2
+        NVIDIA_NEMOTRON_SUPER_3_120B=nvidia.nemotron-super-3-120b
+        OPENAI_GPT_5_4=openai.gpt-5.4
+        OPENAI_GPT_5_4_2026_03_05=openai.gpt-5.4-2026-03-05
+        OPENAI_GPT_5_5=openai.gpt-5.5
+        OPENAI_GPT_5_5_2026_04_23=openai.gpt-5.5-2026-04-23
+        OPENAI_GPT_5_6_LUNA=openai.gpt-5.6-luna
+        OPENAI_GPT_5_6_SOL=openai.gpt-5.6-sol
+        OPENAI_GPT_5_6_TERRA=openai.gpt-5.6-terra
+        OPENAI_GPT_OSS_120B=openai.gpt-oss-120b-1:0
+        OPENAI_GPT_OSS_20B=openai.gpt-oss-20b-1:0
+        OPENAI_GPT_OSS_SAFEGUARD_120B=openai.gpt-oss-safeguard-120b
+        OPENAI_GPT_OSS_SAFEGUARD_20B=openai.gpt-oss-safeguard-20b
+        QWEN_QWEN3_235B_A22B_2507=qwen.qwen3-235b-a22b-2507-v1:0
+        QWEN_QWEN3_32B=qwen.qwen3-32b-v1:0
+        QWEN_QWEN3_CODER_30B_A3B=qwen.qwen3-coder-30b-a3b-v1:0
+        QWEN_QWEN3_CODER_30B_A3B_INSTRUCT=qwen.qwen3-coder-30b-a3b-instruct
+        QWEN_QWEN3_CODER_480B_A35B=qwen.qwen3-coder-480b-a35b-v1:0
+        QWEN_QWEN3_CODER_480B_A35B_INSTRUCT=qwen.qwen3-coder-480b-a35b-instruct
+        QWEN_QWEN3_CODER_NEXT=qwen.qwen3-coder-next
+        QWEN_QWEN3_NEXT_80B_A3B=qwen.qwen3-next-80b-a3b
+        QWEN_QWEN3_NEXT_80B_A3B_INSTRUCT=qwen.qwen3-next-80b-a3b-instruct
+        QWEN_QWEN3_VL_235B_A22B=qwen.qwen3-vl-235b-a22b
+        QWEN_QWEN3_VL_235B_A22B_INSTRUCT=qwen.qwen3-vl-235b-a22b-instruct
+        STABILITY_SD3_5_LARGE=stability.sd3-5-large-v1:0
+        STABILITY_STABLE_CONSERVATIVE_UPSCALE=stability.stable-conservative-upscale-v1:0
+        STABILITY_STABLE_CREATIVE_UPSCALE=stability.stable-creative-upscale-v1:0
+        STABILITY_STABLE_FAST_UPSCALE=stability.stable-fast-upscale-v1:0
+        STABILITY_STABLE_IMAGE_CONTROL_SKETCH=stability.stable-image-control-sketch-v1:0
+        STABILITY_STABLE_IMAGE_CONTROL_STRUCTURE=stability.stable-image-control-structure-v1:0
+        STABILITY_STABLE_IMAGE_CORE=stability.stable-image-core-v1:1
+        STABILITY_STABLE_IMAGE_ERASE_OBJECT=stability.stable-image-erase-object-v1:0
+        STABILITY_STABLE_IMAGE_INPAINT=stability.stable-image-inpaint-v1:0
+        STABILITY_STABLE_IMAGE_REMOVE_BACKGROUND=stability.stable-image-remove-background-v1:0
+        STABILITY_STABLE_IMAGE_SEARCH_RECOLOR=stability.stable-image-search-recolor-v1:0
+        STABILITY_STABLE_IMAGE_SEARCH_REPLACE=stability.stable-image-search-replace-v1:0
+        STABILITY_STABLE_IMAGE_STYLE_GUIDE=stability.stable-image-style-guide-v1:0
+        STABILITY_STABLE_IMAGE_ULTRA=stability.stable-image-ultra-v1:1
+        STABILITY_STABLE_OUTPAINT=stability.stable-outpaint-v1:0
+        STABILITY_STABLE_STYLE_TRANSFER=stability.stable-style-transfer-v1:0
+        TWELVELABS_MARENGO_EMBED_3_0=twelvelabs.marengo-embed-3-0-v1:0
+        TWELVELABS_PEGASUS_1_2=twelvelabs.pegasus-1-2-v1:0
+        WRITER_PALMYRA_VISION_7B=writer.palmyra-vision-7b
+        WRITER_PALMYRA_X4=writer.palmyra-x4-v1:0
+        WRITER_PALMYRA_X5=writer.palmyra-x5-v1:0
+        XAI_GROK_4_3=xai.grok-4.3
+        ZAI_GLM_4_6=zai.glm-4.6
+        ZAI_GLM_4_7=zai.glm-4.7
+        ZAI_GLM_4_7_FLASH=zai.glm-4.7-flash
+        ZAI_GLM_5=zai.glm-5
+        !AI21_JAMBA_1_5_LARGE=ai21.jamba-1-5-large-v1:0
+        !AI21_JAMBA_1_5_MINI=ai21.jamba-1-5-mini-v1:0
+        !AMAZON_NOVA_CANVAS=amazon.nova-canvas-v1:0
+        !AMAZON_NOVA_PREMIER=amazon.nova-premier-v1:0
+        !AMAZON_NOVA_REEL=amazon.nova-reel-v1:1
+        !AMAZON_NOVA_SONIC=amazon.nova-sonic-v1:0
+        !ANTHROPIC_CLAUDE_3_HAIKU_20240307=anthropic.claude-3-haiku-20240307-v1:0
+        !ANTHROPIC_CLAUDE_OPUS_4_1_20250805=anthropic.claude-opus-4-1-20250805-v1:0
+        !ANTHROPIC_CLAUDE_SONNET_4_20250514=anthropic.claude-sonnet-4-20250514-v1:0
+        !COHERE_COMMAND_R=cohere.command-r-v1:0
+        !COHERE_COMMAND_R_PLUS=cohere.command-r-plus-v1:0
+        !TWELVELABS_MARENGO_EMBED_2_7=twelvelabs.marengo-embed-2-7-v1:0
+    """
+
+
+class MantleModels(metaclass=_ModelsMeta):
     """Static class containing Bedrock foundation model IDs as constants for MantleModels."""
 
-    ANTHROPIC_CLAUDE_FABLE_5 = BedrockModel("anthropic.claude-fable-5")
-    ANTHROPIC_CLAUDE_HAIKU_4_5 = BedrockModel("anthropic.claude-haiku-4-5")
-    ANTHROPIC_CLAUDE_OPUS_4_7 = BedrockModel("anthropic.claude-opus-4-7")
-    ANTHROPIC_CLAUDE_OPUS_4_8 = BedrockModel("anthropic.claude-opus-4-8")
-    ANTHROPIC_CLAUDE_OPUS_5 = BedrockModel("anthropic.claude-opus-5")
-    ANTHROPIC_CLAUDE_SONNET_5 = BedrockModel("anthropic.claude-sonnet-5")
-    DEEPSEEK_V3_1 = BedrockModel("deepseek.v3.1")
-    DEEPSEEK_V3_2 = BedrockModel("deepseek.v3.2")
-    GOOGLE_GEMMA_3_12B_IT = BedrockModel("google.gemma-3-12b-it")
-    GOOGLE_GEMMA_3_27B_IT = BedrockModel("google.gemma-3-27b-it")
-    GOOGLE_GEMMA_3_4B_IT = BedrockModel("google.gemma-3-4b-it")
-    GOOGLE_GEMMA_4_26B_A4B = BedrockModel("google.gemma-4-26b-a4b")
-    GOOGLE_GEMMA_4_31B = BedrockModel("google.gemma-4-31b")
-    GOOGLE_GEMMA_4_E2B = BedrockModel("google.gemma-4-e2b")
-    MINIMAX_MINIMAX_M2 = BedrockModel("minimax.minimax-m2")
-    MINIMAX_MINIMAX_M2_1 = BedrockModel("minimax.minimax-m2.1")
-    MINIMAX_MINIMAX_M2_5 = BedrockModel("minimax.minimax-m2.5")
-    MISTRAL_DEVSTRAL_2_123B = BedrockModel("mistral.devstral-2-123b")
-    MISTRAL_MAGISTRAL_SMALL_2509 = BedrockModel("mistral.magistral-small-2509")
-    MISTRAL_MINISTRAL_3_14B_INSTRUCT = BedrockModel("mistral.ministral-3-14b-instruct")
-    MISTRAL_MINISTRAL_3_3B_INSTRUCT = BedrockModel("mistral.ministral-3-3b-instruct")
-    MISTRAL_MINISTRAL_3_8B_INSTRUCT = BedrockModel("mistral.ministral-3-8b-instruct")
-    MISTRAL_MISTRAL_LARGE_3_675B_INSTRUCT = BedrockModel("mistral.mistral-large-3-675b-instruct")
-    MISTRAL_VOXTRAL_MINI_3B_2507 = BedrockModel("mistral.voxtral-mini-3b-2507")
-    MISTRAL_VOXTRAL_SMALL_24B_2507 = BedrockModel("mistral.voxtral-small-24b-2507")
-    MOONSHOTAI_KIMI_K2_5 = BedrockModel("moonshotai.kimi-k2.5")
-    MOONSHOTAI_KIMI_K2_THINKING = BedrockModel("moonshotai.kimi-k2-thinking")
-    NVIDIA_NEMOTRON_NANO_12B = BedrockModel("nvidia.nemotron-nano-12b-v2")
-    NVIDIA_NEMOTRON_NANO_3_30B = BedrockModel("nvidia.nemotron-nano-3-30b")
-    NVIDIA_NEMOTRON_NANO_9B = BedrockModel("nvidia.nemotron-nano-9b-v2")
-    NVIDIA_NEMOTRON_SUPER_3_120B = BedrockModel("nvidia.nemotron-super-3-120b")
-    OPENAI_GPT_5_4 = BedrockModel("openai.gpt-5.4")
-    OPENAI_GPT_5_4_2026_03_05 = BedrockModel("openai.gpt-5.4-2026-03-05")
-    OPENAI_GPT_5_5 = BedrockModel("openai.gpt-5.5")
-    OPENAI_GPT_5_5_2026_04_23 = BedrockModel("openai.gpt-5.5-2026-04-23")
-    OPENAI_GPT_5_6_LUNA = BedrockModel("openai.gpt-5.6-luna")
-    OPENAI_GPT_5_6_SOL = BedrockModel("openai.gpt-5.6-sol")
-    OPENAI_GPT_5_6_TERRA = BedrockModel("openai.gpt-5.6-terra")
-    OPENAI_GPT_OSS_120B = BedrockModel("openai.gpt-oss-120b")
-    OPENAI_GPT_OSS_20B = BedrockModel("openai.gpt-oss-20b")
-    OPENAI_GPT_OSS_SAFEGUARD_120B = BedrockModel("openai.gpt-oss-safeguard-120b")
-    OPENAI_GPT_OSS_SAFEGUARD_20B = BedrockModel("openai.gpt-oss-safeguard-20b")
-    QWEN_QWEN3_235B_A22B_2507 = BedrockModel("qwen.qwen3-235b-a22b-2507")
-    QWEN_QWEN3_32B = BedrockModel("qwen.qwen3-32b")
-    QWEN_QWEN3_CODER_30B_A3B_INSTRUCT = BedrockModel("qwen.qwen3-coder-30b-a3b-instruct")
-    QWEN_QWEN3_CODER_480B_A35B_INSTRUCT = BedrockModel("qwen.qwen3-coder-480b-a35b-instruct")
-    QWEN_QWEN3_CODER_NEXT = BedrockModel("qwen.qwen3-coder-next")
-    QWEN_QWEN3_NEXT_80B_A3B_INSTRUCT = BedrockModel("qwen.qwen3-next-80b-a3b-instruct")
-    QWEN_QWEN3_VL_235B_A22B_INSTRUCT = BedrockModel("qwen.qwen3-vl-235b-a22b-instruct")
-    WRITER_PALMYRA_VISION_7B = BedrockModel("writer.palmyra-vision-7b")
-    XAI_GROK_4_3 = BedrockModel("xai.grok-4.3")
-    ZAI_GLM_4_6 = BedrockModel("zai.glm-4.6")
-    ZAI_GLM_4_7 = BedrockModel("zai.glm-4.7")
-    ZAI_GLM_4_7_FLASH = BedrockModel("zai.glm-4.7-flash")
-    ZAI_GLM_5 = BedrockModel("zai.glm-5")
-
-
-class RuntimeModels:
+    _TABLE = """
+        ANTHROPIC_CLAUDE_FABLE_5=anthropic.claude-fable-5
+        ANTHROPIC_CLAUDE_HAIKU_4_5=anthropic.claude-haiku-4-5
+        ANTHROPIC_CLAUDE_OPUS_4_7=anthropic.claude-opus-4-7
+        ANTHROPIC_CLAUDE_OPUS_4_8=anthropic.claude-opus-4-8
+        ANTHROPIC_CLAUDE_OPUS_5=anthropic.claude-opus-5
+        ANTHROPIC_CLAUDE_SONNET_5=anthropic.claude-sonnet-5
+        DEEPSEEK_V3_1=deepseek.v3.1
+        DEEPSEEK_V3_2=deepseek.v3.2
+        GOOGLE_GEMMA_3_12B_IT=google.gemma-3-12b-it
+        GOOGLE_GEMMA_3_27B_IT=google.gemma-3-27b-it
+        GOOGLE_GEMMA_3_4B_IT=google.gemma-3-4b-it
+        GOOGLE_GEMMA_4_26B_A4B=google.gemma-4-26b-a4b
+        GOOGLE_GEMMA_4_31B=google.gemma-4-31b
+        GOOGLE_GEMMA_4_E2B=google.gemma-4-e2b
+        MINIMAX_MINIMAX_M2=minimax.minimax-m2
+        MINIMAX_MINIMAX_M2_1=minimax.minimax-m2.1
+        MINIMAX_MINIMAX_M2_5=minimax.minimax-m2.5
+        MISTRAL_DEVSTRAL_2_123B=mistral.devstral-2-123b
+        MISTRAL_MAGISTRAL_SMALL_2509=mistral.magistral-small-2509
+        MISTRAL_MINISTRAL_3_14B_INSTRUCT=mistral.ministral-3-14b-instruct
+        MISTRAL_MINISTRAL_3_3B_INSTRUCT=mistral.ministral-3-3b-instruct
+        MISTRAL_MINISTRAL_3_8B_INSTRUCT=mistral.ministral-3-8b-instruct
+        MISTRAL_MISTRAL_LARGE_3_675B_INSTRUCT=mistral.mistral-large-3-675b-instruct
+        MISTRAL_VOXTRAL_MINI_3B_2507=mistral.voxtral-mini-3b-2507
+        MISTRAL_VOXTRAL_SMALL_24B_2507=mistral.voxtral-small-24b-2507
+        MOONSHOTAI_KIMI_K2_5=moonshotai.kimi-k2.5
+        MOONSHOTAI_KIMI_K2_THINKING=moonshotai.kimi-k2-thinking
+        NVIDIA_NEMOTRON_NANO_12B=nvidia.nemotron-nano-12b-v2
+        NVIDIA_NEMOTRON_NANO_3_30B=nvidia.nemotron-nano-3-30b
+        NVIDIA_NEMOTRON_NANO_9B=nvidia.nemotron-nano-9b-v2
+        NVIDIA_NEMOTRON_SUPER_3_120B=nvidia.nemotron-super-3-120b
+        OPENAI_GPT_5_4=openai.gpt-5.4
+        OPENAI_GPT_5_4_2026_03_05=openai.gpt-5.4-2026-03-05
+        OPENAI_GPT_5_5=openai.gpt-5.5
+        OPENAI_GPT_5_5_2026_04_23=openai.gpt-5.5-2026-04-23
+        OPENAI_GPT_5_6_LUNA=openai.gpt-5.6-luna
+        OPENAI_GPT_5_6_SOL=openai.gpt-5.6-sol
+        OPENAI_GPT_5_6_TERRA=openai.gpt-5.6-terra
+        OPENAI_GPT_OSS_120B=openai.gpt-oss-120b
+        OPENAI_GPT_OSS_20B=openai.gpt-oss-20b
+        OPENAI_GPT_OSS_SAFEGUARD_120B=openai.gpt-oss-safeguard-120b
+        OPENAI_GPT_OSS_SAFEGUARD_20B=openai.gpt-oss-safeguard-20b
+        QWEN_QWEN3_235B_A22B_2507=qwen.qwen3-235b-a22b-2507
+        QWEN_QWEN3_32B=qwen.qwen3-32b
+        QWEN_QWEN3_CODER_30B_A3B_INSTRUCT=qwen.qwen3-coder-30b-a3b-instruct
+        QWEN_QWEN3_CODER_480B_A35B_INSTRUCT=qwen.qwen3-coder-480b-a35b-instruct
+        QWEN_QWEN3_CODER_NEXT=qwen.qwen3-coder-next
+        QWEN_QWEN3_NEXT_80B_A3B_INSTRUCT=qwen.qwen3-next-80b-a3b-instruct
+        QWEN_QWEN3_VL_235B_A22B_INSTRUCT=qwen.qwen3-vl-235b-a22b-instruct
+        WRITER_PALMYRA_VISION_7B=writer.palmyra-vision-7b
+        XAI_GROK_4_3=xai.grok-4.3
+        ZAI_GLM_4_6=zai.glm-4.6
+        ZAI_GLM_4_7=zai.glm-4.7
+        ZAI_GLM_4_7_FLASH=zai.glm-4.7-flash
+        ZAI_GLM_5=zai.glm-5
+    """
+
+
+class RuntimeModels(metaclass=_ModelsMeta):
     """Static class containing Bedrock foundation model IDs as constants for RuntimeModels."""
 
-    AMAZON_NOVA_2_LITE = BedrockModel("amazon.nova-2-lite-v1:0")
-    AMAZON_NOVA_2_MULTIMODAL_EMBEDDINGS = BedrockModel("amazon.nova-2-multimodal-embeddings-v1:0")
-    AMAZON_NOVA_2_SONIC = BedrockModel("amazon.nova-2-sonic-v1:0")
-    AMAZON_NOVA_LITE = BedrockModel("amazon.nova-lite-v1:0")
-    AMAZON_NOVA_MICRO = BedrockModel("amazon.nova-micro-v1:0")
-    AMAZON_NOVA_PRO = BedrockModel("amazon.nova-pro-v1:0")
-    AMAZON_RERANK = BedrockModel("amazon.rerank-v1:0")
-    AMAZON_TITAN_EMBED_G1_TEXT_02 = BedrockModel("amazon.titan-embed-g1-text-02")
-    AMAZON_TITAN_EMBED_IMAGE = BedrockModel("amazon.titan-embed-image-v1")
-    AMAZON_TITAN_EMBED_TEXT = BedrockModel("amazon.titan-embed-text-v2:0")
-    ANTHROPIC_CLAUDE_3_5_SONNET_20240620 = BedrockModel("anthropic.claude-3-5-sonnet-20240620-v1:0")
-    ANTHROPIC_CLAUDE_3_5_SONNET_20241022 = BedrockModel("anthropic.claude-3-5-sonnet-20241022-v2:0")
-    ANTHROPIC_CLAUDE_3_7_SONNET_20250219 = BedrockModel("anthropic.claude-3-7-sonnet-20250219-v1:0")
-    ANTHROPIC_CLAUDE_3_SONNET_20240229 = BedrockModel("anthropic.claude-3-sonnet-20240229-v1:0")
-    ANTHROPIC_CLAUDE_FABLE_5 = BedrockModel("anthropic.claude-fable-5")
-    ANTHROPIC_CLAUDE_HAIKU_4_5_20251001 = BedrockModel("anthropic.claude-haiku-4-5-20251001-v1:0")
-    ANTHROPIC_CLAUDE_OPUS_4_5_20251101 = BedrockModel("anthropic.claude-opus-4-5-20251101-v1:0")
-    ANTHROPIC_CLAUDE_OPUS_4_6 = BedrockModel("anthropic.claude-opus-4-6-v1")
-    ANTHROPIC_CLAUDE_OPUS_4_7 = BedrockModel("anthropic.claude-opus-4-7")
-    ANTHROPIC_CLAUDE_OPUS_4_8 = BedrockModel("anthropic.claude-opus-4-8")
-    ANTHROPIC_CLAUDE_OPUS_5 = BedrockModel("anthropic.claude-opus-5")
-    ANTHROPIC_CLAUDE_SONNET_4_5_20250929 = BedrockModel("anthropic.claude-sonnet-4-5-20250929-v1:0")
-    ANTHROPIC_CLAUDE_SONNET_4_6 = BedrockModel("anthropic.claude-sonnet-4-6")
-    ANTHROPIC_CLAUDE_SONNET_5 = BedrockModel("anthropic.claude-sonnet-5")
-    COHERE_EMBED = BedrockModel("cohere.embed-v4:0")
-    COHERE_EMBED_ENGLISH = BedrockModel("cohere.embed-english-v3")
-    COHERE_EMBED_MULTILINGUAL = BedrockModel("cohere.embed-multilingual-v3")
-    COHERE_RERANK = BedrockModel("cohere.rerank-v3-5:0")
-    DEEPSEEK_R1 = BedrockModel("deepseek.r1-v1:0")
-    DEEPSEEK_V3 = BedrockModel("deepseek.v3-v1:0")
-    DEEPSEEK_V3_2 = BedrockModel("deepseek.v3.2")
-    GOOGLE_GEMMA_3_12B_IT = BedrockModel("google.gemma-3-12b-it")
-    GOOGLE_GEMMA_3_27B_IT = BedrockModel("google.gemma-3-27b-it")
-    GOOGLE_GEMMA_3_4B_IT = BedrockModel("google.gemma-3-4b-it")
-    LUMA_RAY = BedrockModel("luma.ray-v2:0")
-    META_LLAMA3_1_70B_INSTRUCT = BedrockModel("meta.llama3-1-70b-instruct-v1:0")
-    META_LLAMA3_1_8B_INSTRUCT = BedrockModel("meta.llama3-1-8b-instruct-v1:0")
-    META_LLAMA3_3_70B_INSTRUCT = BedrockModel("meta.llama3-3-70b-instruct-v1:0")
-    META_LLAMA3_70B_INSTRUCT = BedrockModel("meta.llama3-70b-instruct-v1:0")
-    META_LLAMA3_8B_INSTRUCT = BedrockModel("meta.llama3-8b-instruct-v1:0")
-    META_LLAMA4_MAVERICK_17B_INSTRUCT = BedrockModel("meta.llama4-maverick-17b-instruct-v1:0")
-    META_LLAMA4_SCOUT_17B_INSTRUCT = BedrockModel("meta.llama4-scout-17b-instruct-v1:0")
-    MINIMAX_MINIMAX_M2 = BedrockModel("minimax.minimax-m2")
-    MINIMAX_MINIMAX_M2_1 = BedrockModel("minimax.minimax-m2.1")
-    MINIMAX_MINIMAX_M2_5 = BedrockModel("minimax.minimax-m2.5")
-    MISTRAL_DEVSTRAL_2_123B = BedrockModel("mistral.devstral-2-123b")
-    MISTRAL_MAGISTRAL_SMALL_2509 = BedrockModel("mistral.magistral-small-2509")
-    MISTRAL_MINISTRAL_3_14B_INSTRUCT = BedrockModel("mistral.ministral-3-14b-instruct")
-    MISTRAL_MINISTRAL_3_3B_INSTRUCT = BedrockModel("mistral.ministral-3-3b-instruct")
-    MISTRAL_MINISTRAL_3_8B_INSTRUCT = BedrockModel("mistral.ministral-3-8b-instruct")
-    MISTRAL_MISTRAL_7B_INSTRUCT = BedrockModel("mistral.mistral-7b-instruct-v0:2")
-    MISTRAL_MISTRAL_LARGE_2402 = BedrockModel("mistral.mistral-large-2402-v1:0")
-    MISTRAL_MISTRAL_LARGE_2407 = BedrockModel("mistral.mistral-large-2407-v1:0")
-    MISTRAL_MISTRAL_LARGE_3_675B_INSTRUCT = BedrockModel("mistral.mistral-large-3-675b-instruct")
-    MISTRAL_MISTRAL_SMALL_2402 = BedrockModel("mistral.mistral-small-2402-v1:0")
-    MISTRAL_MIXTRAL_8X7B_INSTRUCT = BedrockModel("mistral.mixtral-8x7b-instruct-v0:1")
-    MISTRAL_PIXTRAL_LARGE_2502 = BedrockModel("mistral.pixtral-large-2502-v1:0")
-    MISTRAL_VOXTRAL_MINI_3B_2507 = BedrockModel("mistral.voxtral-mini-3b-2507")
-    MISTRAL_VOXTRAL_SMALL_24B_2507 = BedrockModel("mistral.voxtral-small-24b-2507")
-    MOONSHOTAI_KIMI_K2_5 = BedrockModel("moonshotai.kimi-k2.5")
-    MOONSHOT_KIMI_K2_THINKING = BedrockModel("moonshot.kimi-k2-thinking")
-    NVIDIA_NEMOTRON_NANO_12B = BedrockModel("nvidia.nemotron-nano-12b-v2")
-    NVIDIA_NEMOTRON_NANO_3_30B = BedrockModel("nvidia.nemotron-nano-3-30b")
-    NVIDIA_NEMOTRON_NANO_9B = BedrockModel("nvidia.nemotron-nano-9b-v2")
-    NVIDIA_NEMOTRON_SUPER_3_120B = BedrockModel("nvidia.nemotron-super-3-120b")
-    OPENAI_GPT_OSS_120B = BedrockModel("openai.gpt-oss-120b-1:0")
-    OPENAI_GPT_OSS_20B = BedrockModel("openai.gpt-oss-20b-1:0")
-    OPENAI_GPT_OSS_SAFEGUARD_120B = BedrockModel("openai.gpt-oss-safeguard-120b")
-    OPENAI_GPT_OSS_SAFEGUARD_20B = BedrockModel("openai.gpt-oss-safeguard-20b")
-    QWEN_QWEN3_235B_A22B_2507 = BedrockModel("qwen.qwen3-235b-a22b-2507-v1:0")
-    QWEN_QWEN3_32B = BedrockModel("qwen.qwen3-32b-v1:0")
-    QWEN_QWEN3_CODER_30B_A3B = BedrockModel("qwen.qwen3-coder-30b-a3b-v1:0")
-    QWEN_QWEN3_CODER_480B_A35B = BedrockModel("qwen.qwen3-coder-480b-a35b-v1:0")
-    QWEN_QWEN3_CODER_NEXT = BedrockModel("qwen.qwen3-coder-next")
-    QWEN_QWEN3_NEXT_80B_A3B = BedrockModel("qwen.qwen3-next-80b-a3b")
-    QWEN_QWEN3_VL_235B_A22B = BedrockModel("qwen.qwen3-vl-235b-a22b")
-    STABILITY_SD3_5_LARGE = BedrockModel("stability.sd3-5-large-v1:0")
-    STABILITY_STABLE_CONSERVATIVE_UPSCALE = BedrockModel("stability.stable-conservative-upscale-v1:0")
-    STABILITY_STABLE_CREATIVE_UPSCALE = BedrockModel("stability.stable-creative-upscale-v1:0")
-    STABILITY_STABLE_FAST_UPSCALE = BedrockModel("stability.stable-fast-upscale-v1:0")
-    STABILITY_STABLE_IMAGE_CONTROL_SKETCH = BedrockModel("stability.stable-image-control-sketch-v1:0")
-    STABILITY_STABLE_IMAGE_CONTROL_STRUCTURE = BedrockModel("stability.stable-image-control-structure-v1:0")
-    STABILITY_STABLE_IMAGE_CORE = BedrockModel("stability.stable-image-core-v1:1")
-    STABILITY_STABLE_IMAGE_ERASE_OBJECT = BedrockModel("stability.stable-image-erase-object-v1:0")
-    STABILITY_STABLE_IMAGE_INPAINT = BedrockModel("stability.stable-image-inpaint-v1:0")
-    STABILITY_STABLE_IMAGE_REMOVE_BACKGROUND = BedrockModel("stability.stable-image-remove-background-v1:0")
-    STABILITY_STABLE_IMAGE_SEARCH_RECOLOR = BedrockModel("stability.stable-image-search-recolor-v1:0")
-    STABILITY_STABLE_IMAGE_SEARCH_REPLACE = BedrockModel("stability.stable-image-search-replace-v1:0")
-    STABILITY_STABLE_IMAGE_STYLE_GUIDE = BedrockModel("stability.stable-image-style-guide-v1:0")
-    STABILITY_STABLE_IMAGE_ULTRA = BedrockModel("stability.stable-image-ultra-v1:1")
-    STABILITY_STABLE_OUTPAINT = BedrockModel("stability.stable-outpaint-v1:0")
-    STABILITY_STABLE_STYLE_TRANSFER = BedrockModel("stability.stable-style-transfer-v1:0")
-    TWELVELABS_MARENGO_EMBED_3_0 = BedrockModel("twelvelabs.marengo-embed-3-0-v1:0")
-    TWELVELABS_PEGASUS_1_2 = BedrockModel("twelvelabs.pegasus-1-2-v1:0")
-    WRITER_PALMYRA_VISION_7B = BedrockModel("writer.palmyra-vision-7b")
-    WRITER_PALMYRA_X4 = BedrockModel("writer.palmyra-x4-v1:0")
-    WRITER_PALMYRA_X5 = BedrockModel("writer.palmyra-x5-v1:0")
-    ZAI_GLM_4_7 = BedrockModel("zai.glm-4.7")
-    ZAI_GLM_4_7_FLASH = BedrockModel("zai.glm-4.7-flash")
-    ZAI_GLM_5 = BedrockModel("zai.glm-5")
-    AI21_JAMBA_1_5_LARGE = _DeprecatedModelDescriptor("ai21.jamba-1-5-large-v1:0", "Model 'ai21.jamba-1-5-large-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    AI21_JAMBA_1_5_MINI = _DeprecatedModelDescriptor("ai21.jamba-1-5-mini-v1:0", "Model 'ai21.jamba-1-5-mini-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    AMAZON_NOVA_CANVAS = _DeprecatedModelDescriptor("amazon.nova-canvas-v1:0", "Model 'amazon.nova-canvas-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    AMAZON_NOVA_PREMIER = _DeprecatedModelDescriptor("amazon.nova-premier-v1:0", "Model 'amazon.nova-premier-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    AMAZON_NOVA_REEL = _DeprecatedModelDescriptor("amazon.nova-reel-v1:1", "Model 'amazon.nova-reel-v1:1' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    AMAZON_NOVA_SONIC = _DeprecatedModelDescriptor("amazon.nova-sonic-v1:0", "Model 'amazon.nova-sonic-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    ANTHROPIC_CLAUDE_3_HAIKU_20240307 = _DeprecatedModelDescriptor("anthropic.claude-3-haiku-20240307-v1:0", "Model 'anthropic.claude-3-haiku-20240307-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    ANTHROPIC_CLAUDE_OPUS_4_1_20250805 = _DeprecatedModelDescriptor("anthropic.claude-opus-4-1-20250805-v1:0", "Model 'anthropic.claude-opus-4-1-20250805-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    ANTHROPIC_CLAUDE_SONNET_4_20250514 = _DeprecatedModelDescriptor("anthropic.claude-sonnet-4-20250514-v1:0", "Model 'anthropic.claude-sonnet-4-20250514-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    COHERE_COMMAND_R = _DeprecatedModelDescriptor("cohere.command-r-v1:0", "Model 'cohere.command-r-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    COHERE_COMMAND_R_PLUS = _DeprecatedModelDescriptor("cohere.command-r-plus-v1:0", "Model 'cohere.command-r-plus-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
-    TWELVELABS_MARENGO_EMBED_2_7 = _DeprecatedModelDescriptor("twelvelabs.marengo-embed-2-7-v1:0", "Model 'twelvelabs.marengo-embed-2-7-v1:0' has LEGACY status and may be removed by AWS. Consider migrating to a newer model.")
+    _TABLE = """
+        AMAZON_NOVA_2_LITE=amazon.nova-2-lite-v1:0
+        AMAZON_NOVA_2_MULTIMODAL_EMBEDDINGS=amazon.nova-2-multimodal-embeddings-v1:0
+        AMAZON_NOVA_2_SONIC=amazon.nova-2-sonic-v1:0
+        AMAZON_NOVA_LITE=amazon.nova-lite-v1:0
+        AMAZON_NOVA_MICRO=amazon.nova-micro-v1:0
+        AMAZON_NOVA_PRO=amazon.nova-pro-v1:0
+        AMAZON_RERANK=amazon.rerank-v1:0
+        AMAZON_TITAN_EMBED_G1_TEXT_02=amazon.titan-embed-g1-text-02
+        AMAZON_TITAN_EMBED_IMAGE=amazon.titan-embed-image-v1
+        AMAZON_TITAN_EMBED_TEXT=amazon.titan-embed-text-v2:0
+        ANTHROPIC_CLAUDE_3_5_SONNET_20240620=anthropic.claude-3-5-sonnet-20240620-v1:0
+        ANTHROPIC_CLAUDE_3_5_SONNET_20241022=anthropic.claude-3-5-sonnet-20241022-v2:0
+        ANTHROPIC_CLAUDE_3_7_SONNET_20250219=anthropic.claude-3-7-sonnet-20250219-v1:0
+        ANTHROPIC_CLAUDE_3_SONNET_20240229=anthropic.claude-3-sonnet-20240229-v1:0
+        ANTHROPIC_CLAUDE_FABLE_5=anthropic.claude-fable-5
+        ANTHROPIC_CLAUDE_HAIKU_4_5_20251001=anthropic.claude-haiku-4-5-20251001-v1:0
+        ANTHROPIC_CLAUDE_OPUS_4_5_20251101=anthropic.claude-opus-4-5-20251101-v1:0
+        ANTHROPIC_CLAUDE_OPUS_4_6=anthropic.claude-opus-4-6-v1
+        ANTHROPIC_CLAUDE_OPUS_4_7=anthropic.claude-opus-4-7
+        ANTHROPIC_CLAUDE_OPUS_4_8=anthropic.claude-opus-4-8
+        ANTHROPIC_CLAUDE_OPUS_5=anthropic.claude-opus-5
+        ANTHROPIC_CLAUDE_SONNET_4_5_20250929=anthropic.claude-sonnet-4-5-20250929-v1:0
+        ANTHROPIC_CLAUDE_SONNET_4_6=anthropic.claude-sonnet-4-6
+        ANTHROPIC_CLAUDE_SONNET_5=anthropic.claude-sonnet-5
+        COHERE_EMBED=cohere.embed-v4:0
+        COHERE_EMBED_ENGLISH=cohere.embed-english-v3
+        COHERE_EMBED_MULTILINGUAL=cohere.embed-multilingual-v3
+        COHERE_RERANK=cohere.rerank-v3-5:0
+        DEEPSEEK_R1=deepseek.r1-v1:0
+        DEEPSEEK_V3=deepseek.v3-v1:0
+        DEEPSEEK_V3_2=deepseek.v3.2
+        GOOGLE_GEMMA_3_12B_IT=google.gemma-3-12b-it
+        GOOGLE_GEMMA_3_27B_IT=google.gemma-3-27b-it
+        GOOGLE_GEMMA_3_4B_IT=google.gemma-3-4b-it
+        LUMA_RAY=luma.ray-v2:0
+        META_LLAMA3_1_70B_INSTRUCT=meta.llama3-1-70b-instruct-v1:0
+        META_LLAMA3_1_8B_INSTRUCT=meta.llama3-1-8b-instruct-v1:0
+        META_LLAMA3_3_70B_INSTRUCT=meta.llama3-3-70b-instruct-v1:0
+        META_LLAMA3_70B_INSTRUCT=meta.llama3-70b-instruct-v1:0
+        META_LLAMA3_8B_INSTRUCT=meta.llama3-8b-instruct-v1:0
+        META_LLAMA4_MAVERICK_17B_INSTRUCT=meta.llama4-maverick-17b-instruct-v1:0
+        META_LLAMA4_SCOUT_17B_INSTRUCT=meta.llama4-scout-17b-instruct-v1:0
+        MINIMAX_MINIMAX_M2=minimax.minimax-m2
+        MINIMAX_MINIMAX_M2_1=minimax.minimax-m2.1
+        MINIMAX_MINIMAX_M2_5=minimax.minimax-m2.5
+        MISTRAL_DEVSTRAL_2_123B=mistral.devstral-2-123b
+        MISTRAL_MAGISTRAL_SMALL_2509=mistral.magistral-small-2509
+        MISTRAL_MINISTRAL_3_14B_INSTRUCT=mistral.ministral-3-14b-instruct
+        MISTRAL_MINISTRAL_3_3B_INSTRUCT=mistral.ministral-3-3b-instruct
+        MISTRAL_MINISTRAL_3_8B_INSTRUCT=mistral.ministral-3-8b-instruct
+        MISTRAL_MISTRAL_7B_INSTRUCT=mistral.mistral-7b-instruct-v0:2
+        MISTRAL_MISTRAL_LARGE_2402=mistral.mistral-large-2402-v1:0
+        MISTRAL_MISTRAL_LARGE_2407=mistral.mistral-large-2407-v1:0
+        MISTRAL_MISTRAL_LARGE_3_675B_INSTRUCT=mistral.mistral-large-3-675b-instruct
+        MISTRAL_MISTRAL_SMALL_2402=mistral.mistral-small-2402-v1:0
+        MISTRAL_MIXTRAL_8X7B_INSTRUCT=mistral.mixtral-8x7b-instruct-v0:1
+        MISTRAL_PIXTRAL_LARGE_2502=mistral.pixtral-large-2502-v1:0
+        MISTRAL_VOXTRAL_MINI_3B_2507=mistral.voxtral-mini-3b-2507
+        MISTRAL_VOXTRAL_SMALL_24B_2507=mistral.voxtral-small-24b-2507
+        MOONSHOTAI_KIMI_K2_5=moonshotai.kimi-k2.5
+        MOONSHOT_KIMI_K2_THINKING=moonshot.kimi-k2-thinking
+        NVIDIA_NEMOTRON_NANO_12B=nvidia.nemotron-nano-12b-v2
+        NVIDIA_NEMOTRON_NANO_3_30B=nvidia.nemotron-nano-3-30b
+        NVIDIA_NEMOTRON_NANO_9B=nvidia.nemotron-nano-9b-v2
+        NVIDIA_NEMOTRON_SUPER_3_120B=nvidia.nemotron-super-3-120b
+        OPENAI_GPT_OSS_120B=openai.gpt-oss-120b-1:0
+        OPENAI_GPT_OSS_20B=openai.gpt-oss-20b-1:0
+        OPENAI_GPT_OSS_SAFEGUARD_120B=openai.gpt-oss-safeguard-120b
+        OPENAI_GPT_OSS_SAFEGUARD_20B=openai.gpt-oss-safeguard-20b
+        QWEN_QWEN3_235B_A22B_2507=qwen.qwen3-235b-a22b-2507-v1:0
+        QWEN_QWEN3_32B=qwen.qwen3-32b-v1:0
+        QWEN_QWEN3_CODER_30B_A3B=qwen.qwen3-coder-30b-a3b-v1:0
+        QWEN_QWEN3_CODER_480B_A35B=qwen.qwen3-coder-480b-a35b-v1:0
+        QWEN_QWEN3_CODER_NEXT=qwen.qwen3-coder-next
+        QWEN_QWEN3_NEXT_80B_A3B=qwen.qwen3-next-80b-a3b
+        QWEN_QWEN3_VL_235B_A22B=qwen.qwen3-vl-235b-a22b
+        STABILITY_SD3_5_LARGE=stability.sd3-5-large-v1:0
+        STABILITY_STABLE_CONSERVATIVE_UPSCALE=stability.stable-conservative-upscale-v1:0
+        STABILITY_STABLE_CREATIVE_UPSCALE=stability.stable-creative-upscale-v1:0
+        STABILITY_STABLE_FAST_UPSCALE=stability.stable-fast-upscale-v1:0
+        STABILITY_STABLE_IMAGE_CONTROL_SKETCH=stability.stable-image-control-sketch-v1:0
+        STABILITY_STABLE_IMAGE_CONTROL_STRUCTURE=stability.stable-image-control-structure-v1:0
+        STABILITY_STABLE_IMAGE_CORE=stability.stable-image-core-v1:1
+        STABILITY_STABLE_IMAGE_ERASE_OBJECT=stability.stable-image-erase-object-v1:0
+        STABILITY_STABLE_IMAGE_INPAINT=stability.stable-image-inpaint-v1:0
+        STABILITY_STABLE_IMAGE_REMOVE_BACKGROUND=stability.stable-image-remove-background-v1:0
+        STABILITY_STABLE_IMAGE_SEARCH_RECOLOR=stability.stable-image-search-recolor-v1:0
+        STABILITY_STABLE_IMAGE_SEARCH_REPLACE=stability.stable-image-search-replace-v1:0
+        STABILITY_STABLE_IMAGE_STYLE_GUIDE=stability.stable-image-style-guide-v1:0
+        STABILITY_STABLE_IMAGE_ULTRA=stability.stable-image-ultra-v1:1
+        STABILITY_STABLE_OUTPAINT=stability.stable-outpaint-v1:0
+        STABILITY_STABLE_STYLE_TRANSFER=stability.stable-style-transfer-v1:0
+        TWELVELABS_MARENGO_EMBED_3_0=twelvelabs.marengo-embed-3-0-v1:0
+        TWELVELABS_PEGASUS_1_2=twelvelabs.pegasus-1-2-v1:0
+        WRITER_PALMYRA_VISION_7B=writer.palmyra-vision-7b
+        WRITER_PALMYRA_X4=writer.palmyra-x4-v1:0
+        WRITER_PALMYRA_X5=writer.palmyra-x5-v1:0
+        ZAI_GLM_4_7=zai.glm-4.7
+        ZAI_GLM_4_7_FLASH=zai.glm-4.7-flash
+        ZAI_GLM_5=zai.glm-5
+        !AI21_JAMBA_1_5_LARGE=ai21.jamba-1-5-large-v1:0
+        !AI21_JAMBA_1_5_MINI=ai21.jamba-1-5-mini-v1:0
+        !AMAZON_NOVA_CANVAS=amazon.nova-canvas-v1:0
+        !AMAZON_NOVA_PREMIER=amazon.nova-premier-v1:0
+        !AMAZON_NOVA_REEL=amazon.nova-reel-v1:1
+        !AMAZON_NOVA_SONIC=amazon.nova-sonic-v1:0
+        !ANTHROPIC_CLAUDE_3_HAIKU_20240307=anthropic.claude-3-haiku-20240307-v1:0
+        !ANTHROPIC_CLAUDE_OPUS_4_1_20250805=anthropic.claude-opus-4-1-20250805-v1:0
+        !ANTHROPIC_CLAUDE_SONNET_4_20250514=anthropic.claude-sonnet-4-20250514-v1:0
+        !COHERE_COMMAND_R=cohere.command-r-v1:0
+        !COHERE_COMMAND_R_PLUS=cohere.command-r-plus-v1:0
+        !TWELVELABS_MARENGO_EMBED_2_7=twelvelabs.marengo-embed-2-7-v1:0
+    """
+
+
+def __getattr__(name: str) -> BedrockModel:
+    """
+    Expose Models constants as module attributes (PEP 562).
+
+    Active constants are cached in the module globals, so later accesses are
+    plain dict hits; deprecated ones warn on every access, like Models.
+    """
+    if name not in Models._INDEX:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    model_id = Models._DEPRECATED.get(name)
+    if model_id is not None:
+        return _deprecated_model(model_id)
+    model = globals()[name] = getattr(Models, name)
+    return model
@@ -1,10 +1,20 @@
-from typing import Final, Optional
+from typing import Final, Iterator, Optional
 
 class BedrockModel(str):
     def cris(self, region: Optional[str] = None) -> str: ...
     def global_cris(self, region: Optional[str] = None) -> str: ...
+    def resolve(self, region: Optional[str] = None, prefer_global: bool = False) -> tuple[str, str]: ...
+    @property
+    def available_regions(self) -> tuple[str, ...]: ...
 
-class Models:
+class _ModelsMeta(type):
+    def __iter__(cls) -> Iterator[str]: ...
+    def is_deprecated(cls, model_id: str) -> bool: ...
+    def as_str(cls, model: str) -> str: ...
+
+def clear_caches() -> None: ...
+
+class Models(metaclass=_ModelsMeta):
 
     AMAZON_NOVA_2_LITE: Final[BedrockModel]
     AMAZON_NOVA_2_MULTIMODAL_EMBEDDINGS: Final[BedrockModel]
@@ -138,7 +148,7 @@ class Models:
     COHERE_COMMAND_R_PLUS: Final[BedrockModel]  # deprecated: Model 'cohere.command-r-plus-v1:0' has LEGACY status
     TWELVELABS_MARENGO_EMBED_2_7: Final[BedrockModel]  # deprecated: Model 'twelvelabs.marengo-embed-2-7-v1:0' has LEGACY status
 
-class MantleModels:
+class MantleModels(metaclass=_ModelsMeta):
 
     ANTHROPIC_CLAUDE_FABLE_5: Final[BedrockModel]
     ANTHROPIC_CLAUDE_HAIKU_4_5: Final[BedrockModel]
@@ -196,7 +206,7 @@ class MantleModels:
     ZAI_GLM_4_7_FLASH: Final[BedrockModel]
     ZAI_GLM_5: Final[BedrockModel]
 
-class RuntimeModels:
+class RuntimeModels(metaclass=_ModelsMeta):
 
     AMAZON_NOVA_2_LITE: Final[BedrockModel]
     AMAZON_NOVA_2_MULTIMODAL_EMBEDDINGS: Final[BedrockModel]
@@ -310,3 +320,136 @@ class RuntimeModels:
     COHERE_COMMAND_R: Final[BedrockModel]  # deprecated: Model 'cohere.command-r-v1:0' has LEGACY status
     COHERE_COMMAND_R_PLUS: Final[BedrockModel]  # deprecated: Model 'cohere.command-r-plus-v1:0' has LEGACY status
     TWELVELABS_MARENGO_EMBED_2_7: Final[BedrockModel]  # deprecated: Model 'twelvelabs.marengo-embed-2-7-v1:0' has LEGACY status
+
+# Models constants, also available as module attributes
+AMAZON_NOVA_2_LITE: Final[BedrockModel]
+AMAZON_NOVA_2_MULTIMODAL_EMBEDDINGS: Final[BedrockModel]
+AMAZON_NOVA_2_SONIC: Final[BedrockModel]
+AMAZON_NOVA_LITE: Final[BedrockModel]
+AMAZON_NOVA_MICRO: Final[BedrockModel]
+AMAZON_NOVA_PRO: Final[BedrockModel]
+AMAZON_RERANK: Final[BedrockModel]
+AMAZON_TITAN_EMBED_G1_TEXT_02: Final[BedrockModel]
+AMAZON_TITAN_EMBED_IMAGE: Final[BedrockModel]
+AMAZON_TITAN_EMBED_TEXT: Final[BedrockModel]
+ANTHROPIC_CLAUDE_3_5_SONNET_20240620: Final[BedrockModel]
+ANTHROPIC_CLAUDE_3_5_SONNET_20241022: Final[BedrockModel]
+ANTHROPIC_CLAUDE_3_7_SONNET_20250219: Final[BedrockModel]
+ANTHROPIC_CLAUDE_3_SONNET_20240229: Final[BedrockModel]
+ANTHROPIC_CLAUDE_FABLE_5: Final[BedrockModel]
+ANTHROPIC_CLAUDE_HAIKU_4_5: Final[BedrockModel]
+ANTHROPIC_CLAUDE_HAIKU_4_5_20251001: Final[BedrockModel]
+ANTHROPIC_CLAUDE_OPUS_4_5_20251101: Final[BedrockModel]
+ANTHROPIC_CLAUDE_OPUS_4_6: Final[BedrockModel]
+ANTHROPIC_CLAUDE_OPUS_4_7: Final[BedrockModel]
+ANTHROPIC_CLAUDE_OPUS_4_8: Final[BedrockModel]
+ANTHROPIC_CLAUDE_OPUS_5: Final[BedrockModel]
+ANTHROPIC_CLAUDE_SONNET_4_5_20250929: Final[BedrockModel]
+ANTHROPIC_CLAUDE_SONNET_4_6: Final[BedrockModel]
+ANTHROPIC_CLAUDE_SONNET_5: Final[BedrockModel]
+COHERE_EMBED: Final[BedrockModel]
+COHERE_EMBED_ENGLISH: Final[BedrockModel]
+COHERE_EMBED_MULTILINGUAL: Final[BedrockModel]
+COHERE_RERANK: Final[BedrockModel]
+DEEPSEEK_R1: Final[BedrockModel]
+DEEPSEEK_V3: Final[BedrockModel]
+DEEPSEEK_V3_1: Final[BedrockModel]
+DEEPSEEK_V3_2: Final[BedrockModel]
+GOOGLE_GEMMA_3_12B_IT: Final[BedrockModel]
+GOOGLE_GEMMA_3_27B_IT: Final[BedrockModel]
+GOOGLE_GEMMA_3_4B_IT: Final[BedrockModel]
+GOOGLE_GEMMA_4_26B_A4B: Final[BedrockModel]
+GOOGLE_GEMMA_4_31B: Final[BedrockModel]
+GOOGLE_GEMMA_4_E2B: Final[BedrockModel]
+LUMA_RAY: Final[BedrockModel]
+META_LLAMA3_1_70B_INSTRUCT: Final[BedrockModel]
+META_LLAMA3_1_8B_INSTRUCT: Final[BedrockModel]
+META_LLAMA3_3_70B_INSTRUCT: Final[BedrockModel]
+META_LLAMA3_70B_INSTRUCT: Final[BedrockModel]
+META_LLAMA3_8B_INSTRUCT: Final[BedrockModel]
+META_LLAMA4_MAVERICK_17B_INSTRUCT: Final[BedrockModel]
+META_LLAMA4_SCOUT_17B_INSTRUCT: Final[BedrockModel]
+MINIMAX_MINIMAX_M2: Final[BedrockModel]
+MINIMAX_MINIMAX_M2_1: Final[BedrockModel]
+MINIMAX_MINIMAX_M2_5: Final[BedrockModel]
+MISTRAL_DEVSTRAL_2_123B: Final[BedrockModel]
+MISTRAL_MAGISTRAL_SMALL_2509: Final[BedrockModel]
+MISTRAL_MINISTRAL_3_14B_INSTRUCT: Final[BedrockModel]
+MISTRAL_MINISTRAL_3_3B_INSTRUCT: Final[BedrockModel]
+MISTRAL_MINISTRAL_3_8B_INSTRUCT: Final[BedrockModel]
+MISTRAL_MISTRAL_7B_INSTRUCT: Final[BedrockModel]
+MISTRAL_MISTRAL_LARGE_2402: Final[BedrockModel]
+MISTRAL_MISTRAL_LARGE_2407: Final[BedrockModel]
+MISTRAL_MISTRAL_LARGE_3_675B_INSTRUCT: Final[BedrockModel]
+MISTRAL_MISTRAL_SMALL_2402: Final[BedrockModel]
+MISTRAL_MIXTRAL_8X7B_INSTRUCT: Final[BedrockModel]
+MISTRAL_PIXTRAL_LARGE_2502: Final[BedrockModel]
+MISTRAL_VOXTRAL_MINI_3B_2507: Final[BedrockModel]
+MISTRAL_VOXTRAL_SMALL_24B_2507: Final[BedrockModel]
+MOONSHOTAI_KIMI_K2_5: Final[BedrockModel]
+MOONSHOTAI_KIMI_K2_THINKING: Final[BedrockModel]
+MOONSHOT_KIMI_K2_THINKING: Final[BedrockModel]
+NVIDIA_NEMOTRON_NANO_12B: Final[BedrockModel]
+NVIDIA_NEMOTRON_NANO_3_30B: Final[BedrockModel]
+NVIDIA_NEMOTRON_NANO_9B: Final[BedrockModel]
+NVIDIA_NEMOTRON_SUPER_3_120B: Final[BedrockModel]
+OPENAI_GPT_5_4: Final[BedrockModel]
+OPENAI_GPT_5_4_2026_03_05: Final[BedrockModel]
+OPENAI_GPT_5_5: Final[BedrockModel]
+OPENAI_GPT_5_5_2026_04_23: Final[BedrockModel]
+OPENAI_GPT_5_6_LUNA: Final[BedrockModel]
+OPENAI_GPT_5_6_SOL: Final[BedrockModel]
+OPENAI_GPT_5_6_TERRA: Final[BedrockModel]
+OPENAI_GPT_OSS_120B: Final[BedrockModel]
+OPENAI_GPT_OSS_20B: Final[BedrockModel]
+OPENAI_GPT_OSS_SAFEGUARD_120B: Final[BedrockModel]
+OPENAI_GPT_OSS_SAFEGUARD_20B: Final[BedrockModel]
+QWEN_QWEN3_235B_A22B_2507: Final[BedrockModel]
+QWEN_QWEN3_32B: Final[BedrockModel]
+QWEN_QWEN3_CODER_30B_A3B: Final[BedrockModel]
+QWEN_QWEN3_CODER_30B_A3B_INSTRUCT: Final[BedrockModel]
+QWEN_QWEN3_CODER_480B_A35B: Final[BedrockModel]
+QWEN_QWEN3_CODER_480B_A35B_INSTRUCT: Final[BedrockModel]
+QWEN_QWEN3_CODER_NEXT: Final[BedrockModel]
+QWEN_QWEN3_NEXT_80B_A3B: Final[BedrockModel]
+QWEN_QWEN3_NEXT_80B_A3B_INSTRUCT: Final[BedrockModel]
+QWEN_QWEN3_VL_235B_A22B: Final[BedrockModel]
+QWEN_QWEN3_VL_235B_A22B_INSTRUCT: Final[BedrockModel]
+STABILITY_SD3_5_LARGE: Final[BedrockModel]
+STABILITY_STABLE_CONSERVATIVE_UPSCALE: Final[BedrockModel]
+STABILITY_STABLE_CREATIVE_UPSCALE: Final[BedrockModel]
+STABILITY_STABLE_FAST_UPSCALE: Final[BedrockModel]
+STABILITY_STABLE_IMAGE_CONTROL_SKETCH: Final[BedrockModel]
+STABILITY_STABLE_IMAGE_CONTROL_STRUCTURE: Final[BedrockModel]
+STABILITY_STABLE_IMAGE_CORE: Final[BedrockModel]
+STABILITY_STABLE_IMAGE_ERASE_OBJECT: Final[BedrockModel]
+STABILITY_STABLE_IMAGE_INPAINT: Final[BedrockModel]
+STABILITY_STABLE_IMAGE_REMOVE_BACKGROUND: Final[BedrockModel]
+STABILITY_STABLE_IMAGE_SEARCH_RECOLOR: Final[BedrockModel]
+STABILITY_STABLE_IMAGE_SEARCH_REPLACE: Final[BedrockModel]
+STABILITY_STABLE_IMAGE_STYLE_GUIDE: Final[BedrockModel]
+STABILITY_STABLE_IMAGE_ULTRA: Final[BedrockModel]
+STABILITY_STABLE_OUTPAINT: Final[BedrockModel]
+STABILITY_STABLE_STYLE_TRANSFER: Final[BedrockModel]
+TWELVELABS_MARENGO_EMBED_3_0: Final[BedrockModel]
+TWELVELABS_PEGASUS_1_2: Final[BedrockModel]
+WRITER_PALMYRA_VISION_7B: Final[BedrockModel]
+WRITER_PALMYRA_X4: Final[BedrockModel]
+WRITER_PALMYRA_X5: Final[BedrockModel]
+XAI_GROK_4_3: Final[BedrockModel]
+ZAI_GLM_4_6: Final[BedrockModel]
+ZAI_GLM_4_7: Final[BedrockModel]
+ZAI_GLM_4_7_FLASH: Final[BedrockModel]
+ZAI_GLM_5: Final[BedrockModel]
+AI21_JAMBA_1_5_LARGE: Final[BedrockModel]  # deprecated
+AI21_JAMBA_1_5_MINI: Final[BedrockModel]  # deprecated
+AMAZON_NOVA_CANVAS: Final[BedrockModel]  # deprecated
+AMAZON_NOVA_PREMIER: Final[BedrockModel]  # deprecated
+AMAZON_NOVA_REEL: Final[BedrockModel]  # deprecated
+AMAZON_NOVA_SONIC: Final[BedrockModel]  # deprecated
+ANTHROPIC_CLAUDE_3_HAIKU_20240307: Final[BedrockModel]  # deprecated
+ANTHROPIC_CLAUDE_OPUS_4_1_20250805: Final[BedrockModel]  # deprecated
+ANTHROPIC_CLAUDE_SONNET_4_20250514: Final[BedrockModel]  # deprecated
+COHERE_COMMAND_R: Final[BedrockModel]  # deprecated
+COHERE_COMMAND_R_PLUS: Final[BedrockModel]  # deprecated
+TWELVELABS_MARENGO_EMBED_2_7: Final[BedrockModel]  # deprecated
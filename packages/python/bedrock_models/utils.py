@@ -2,9 +2,10 @@
 Utility functions for working with Bedrock model IDs.
 """
 
+import functools
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 
 def load_model_data() -> dict:
@@ -14,6 +15,22 @@ def load_model_data() -> dict:
         return json.load(f)
 
 
+@functools.lru_cache(maxsize=1)
+def _model_data() -> dict:
+    """
+    Parsed bedrock_models.json, shared by the lookup helpers.
+
+    Loaded once per process; the result must not be mutated, so helpers copy
+    any list they hand back to the caller.
+    """
+    return load_model_data()
+
+
+def clear_caches() -> None:
+    """Drop the cached model data, so the next lookup reloads bedrock_models.json."""
+    _model_data.cache_clear()
+
+
 def _get_region_from_boto3() -> Optional[str]:
     """
     Try to get the AWS region from boto3 session.
@@ -54,7 +71,7 @@ def is_model_available(model_id: str, region: Optional[str] = None) -> bool:
                 "Region must be provided or boto3 must be configured with a default region."
             )
 
-        model_data = load_model_data()
+        model_data = _model_data()
         if model_id not in model_data:
             return False
         available_regions = model_data[model_id].get("regions", [])
@@ -78,10 +95,10 @@ def get_available_regions(model_id: str) -> list[str]:
     Raises:
         ValueError: If model_id is not found
     """
-    model_data = load_model_data()
+    model_data = _model_data()
     if model_id not in model_data:
         raise ValueError(f"Model ID '{model_id}' not found in bedrock_models.json")
-    return model_data[model_id].get("regions", [])
+    return list(model_data[model_id].get("regions", []))
 
 
 def has_global_profile(model_id: str, region: str) -> bool:
@@ -96,7 +113,7 @@ def has_global_profile(model_id: str, region: str) -> bool:
         True if the model has GLOBAL inference type in the region, False otherwise
     """
     try:
-        model_data = load_model_data()
+        model_data = _model_data()
         if model_id not in model_data:
             return False
         inference_types = model_data[model_id].get("inference_types", {}).get(region, [])
@@ -122,7 +139,7 @@ def get_inference_profiles(model_id: str, region: str) -> list[str]:
         ["US", "GLOBAL"]
     """
     try:
-        model_data = load_model_data()
+        model_data = _model_data()
         if model_id not in model_data:
             return []
         
@@ -152,11 +169,11 @@ def get_inference_types(model_id: str, region: str) -> list[str]:
         ["ON_DEMAND", "US", "GLOBAL"]
     """
     try:
-        model_data = load_model_data()
+        model_data = _model_data()
         if model_id not in model_data:
             return []
         
-        return model_data[model_id].get("inference_types", {}).get(region, [])
+        return list(model_data[model_id].get("inference_types", {}).get(region, []))
     except Exception:
         return []
 
@@ -199,7 +216,7 @@ def cris_model_id(model_id: str, region: Optional[str] = None) -> str:
         )
 
     # Load model data
-    model_data = load_model_data()
+    model_data = _model_data()
 
     # Validate model exists
     if model_id not in model_data:
@@ -267,7 +284,7 @@ def global_model_id(model_id: str, region: Optional[str] = None) -> str:
     # Check if model has global profile in this region
     if not has_global_profile(model_id, region):
         # Load model data for better error message
-        model_data = load_model_data()
+        model_data = _model_data()
         if model_id not in model_data:
             raise ValueError(f"Model ID '{model_id}' not found in bedrock_models.json")
 
@@ -287,3 +304,55 @@ def global_model_id(model_id: str, region: Optional[str] = None) -> str:
         )
 
     return f"global.{model_id}"
+
+
+def resolve_endpoint(
+    model_id: str, region: Optional[str] = None, prefer_global: bool = False
+) -> tuple[str, Literal["global", "cris", "direct", "unavailable"]]:
+    """
+    Resolve the best endpoint for a model in a region with a single data lookup.
+
+    Like cris_model_id, a geo-specific CRIS profile is preferred over the global
+    inference profile; a model with neither is invoked directly.
+
+    Args:
+        model_id: The model ID
+        region: The AWS region. If not provided, will attempt to get from boto3 session.
+        prefer_global: Try the global inference profile before the geo-specific one.
+
+    Returns:
+        Tuple of (endpoint_id, kind). For "direct" and "unavailable" the
+        endpoint ID is the model ID itself.
+
+    Examples:
+        >>> resolve_endpoint("anthropic.claude-sonnet-4-5-20250929-v1:0", region="us-east-1")
+        ("us.anthropic.claude-sonnet-4-5-20250929-v1:0", "cris")
+
+        >>> resolve_endpoint("anthropic.claude-sonnet-4-5-20250929-v1:0", region="us-east-1", prefer_global=True)
+        ("global.anthropic.claude-sonnet-4-5-20250929-v1:0", "global")
+
+    Raises:
+        ValueError: If region cannot be determined
+    """
+    if region is None:
+        region = _get_region_from_boto3()
+
+    if region is None:
+        raise ValueError(
+            "Region must be provided or boto3 must be configured with a default region."
+        )
+
+    entry = _model_data().get(model_id)
+    if entry is None or region not in entry.get("regions", []):
+        return model_id, "unavailable"
+
+    inference_types = entry.get("inference_types", {}).get(region, [])
+    has_global = "GLOBAL" in inference_types
+    if has_global and prefer_global:
+        return f"global.{model_id}", "global"
+    for inference_type in inference_types:
+        if inference_type not in ("GLOBAL", "ON_DEMAND", "PROVISIONED"):
+            return f"{inference_type.lower()}.{model_id}", "cris"
+    if has_global:
+        return f"global.{model_id}", "global"
+    return model_id, "direct"
@@ -5,8 +5,7 @@ Quick start example for bedrock-models library.
 
 from bedrock_models import (
     Models,
-    cris_model_id,
-    is_model_available,
+    resolve_endpoint,
     get_available_regions,
 )
 
@@ -14,14 +13,12 @@ from bedrock_models import (
 model = Models.ANTHROPIC_CLAUDE_3_5_SONNET_20241022
 print(f"Model ID: {model}")
 
-# 2. Check if available in your region
+# 2. Resolve the best endpoint in your region (global, geo CRIS or direct)
 region = "us-east-1"
-if is_model_available(model, region):
+model_id, kind = resolve_endpoint(model, region)
+if kind != "unavailable":
     print(f"✓ Available in {region}")
-    
-    # 3. Get the best CRIS ID (automatically chooses geo or global)
-    model_id = cris_model_id(model, region=region)
-    print(f"CRIS ID: {model_id}")
+    print(f"Endpoint ({kind}): {model_id}")
 else:
     print(f"✗ Not available in {region}")
     
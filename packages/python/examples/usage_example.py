@@ -7,6 +7,8 @@ AWS Bedrock model IDs, check availability, and generate cross-region
 inference profile IDs.
 """
 
+from pathlib import Path
+
 from bedrock_models import (
     Models,
     is_model_available,
@@ -78,10 +80,10 @@ def example_check_availability():
     available = is_model_available(model, region)
     print(f"Is {model} available in {region}? {available}")
     
-    # Get all available regions
-    regions = get_available_regions(model)
+    # Get all available regions (sorted once and cached on the model)
+    regions = model.available_regions
     print(f"\n{model} is available in {len(regions)} regions:")
-    for region in sorted(regions):
+    for region in regions:
         print(f"  - {region}")
     print()
 
@@ -122,7 +124,7 @@ def example_practical_use_case():
     print("PRACTICAL USE CASE: Selecting Best Endpoint")
     print("=" * 80)
     
-    from bedrock_models import cris_model_id, global_model_id
+    from bedrock_models import resolve_endpoint
     
     model = Models.ANTHROPIC_CLAUDE_3_5_SONNET_20241022
     preferred_region = "us-east-1"
@@ -130,23 +132,17 @@ def example_practical_use_case():
     print(f"Model: {model}")
     print(f"Preferred region: {preferred_region}")
     
-    # Check if model is available in preferred region
-    if is_model_available(model, preferred_region):
-        print(f"✓ Model is available in {preferred_region}")
-        
-        # Try to use global profile first (better latency/availability)
-        try:
-            endpoint_id = global_model_id(model, region=preferred_region)
-            print(f"✓ Using global profile: {endpoint_id}")
-        except ValueError:
-            # Fall back to CRIS (geo or global)
-            endpoint_id = cris_model_id(model, region=preferred_region)
-            print(f"→ Using CRIS: {endpoint_id}")
-    else:
+    # Resolve the best endpoint in one lookup:
+    # global profile first (better latency/availability), then geo CRIS, then direct
+    endpoint_id, kind = resolve_endpoint(model, preferred_region, prefer_global=True)
+    if kind == "unavailable":
         print(f"✗ Model not available in {preferred_region}")
         # Find alternative regions
         available_regions = get_available_regions(model)
         print(f"Available in: {', '.join(available_regions[:3])}...")
+    else:
+        print(f"✓ Model is available in {preferred_region}")
+        print(f"✓ Using {kind} endpoint: {endpoint_id}")
     print()
 
 
@@ -156,39 +152,9 @@ def example_boto3_integration():
     print("BOTO3 INTEGRATION EXAMPLE")
     print("=" * 80)
     
-    print("Example code for using with boto3:\n")
-    
-    code = '''
-import boto3
-from bedrock_models import Models, cris_model_id, global_model_id
-
-# Initialize Bedrock client
-bedrock = boto3.client('bedrock-runtime', region_name='us-east-1')
-
-# Select model
-model = Models.ANTHROPIC_CLAUDE_3_5_SONNET_20241022
-
-# Choose the best endpoint (try global first, fall back to CRIS)
-try:
-    model_id = global_model_id(model, region='us-east-1')
-except ValueError:
-    model_id = cris_model_id(model, region='us-east-1')
-
-# Or simply use cris_model_id which automatically chooses the best option
-model_id = cris_model_id(model, region='us-east-1')
-
-# Make API call
-response = bedrock.invoke_model(
-    modelId=model_id,
-    body=json.dumps({
-        "anthropic_version": "bedrock-2023-05-31",
-        "max_tokens": 1024,
-        "messages": [
-            {"role": "user", "content": "Hello!"}
-        ]
-    })
-)
-'''
+    print("Example code for using with boto3:\n\n")
+    
+    code = (Path(__file__).parent / "boto3_snippet.txt").read_text()
     print(code)
 
 
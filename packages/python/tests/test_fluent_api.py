@@ -1,10 +1,27 @@
 """Tests for the Python fluent API."""
 
+import pickle
 import pytest
 import warnings
-from bedrock_models import Models
-from bedrock_models.utils import load_model_data
-from bedrock_models.bedrock_model_ids import _DeprecatedModelDescriptor
+from bedrock_models import Models, bedrock_model_ids, clear_caches
+from bedrock_models.bedrock_model_ids import BedrockModel, _cris_cached
+from bedrock_models.utils import get_available_regions, load_model_data
+
+
+def model_constants():
+    """
+    Return (name, model) for every Models constant, without emitting the
+    deprecation warnings of the legacy ones.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        return [(name, getattr(Models, name)) for name in Models]
+
+
+def deprecated_constant_name():
+    """Return the name of the first deprecated Models constant."""
+    return next(name for name, model in model_constants() if Models.is_deprecated(model))
+
 
 def get_dynamic_model(condition):
     """
@@ -12,26 +29,13 @@ def get_dynamic_model(condition):
     Returns (model_id_str, attribute_value, region, data) or (None, None, None, None)
     """
     model_data = load_model_data()
-    for name, attr in vars(Models).items():
-        if name.startswith("_") or name == "m":
-            continue
-            
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            try:
-                model = getattr(Models, name)
-            except Exception:
-                continue
-                
-        if not isinstance(model, str):
-            continue
-            
+    for name, model in model_constants():
         m_id = str(model)
         if m_id not in model_data:
             continue
-            
+
         data = model_data[m_id]
-        is_legacy = isinstance(attr, _DeprecatedModelDescriptor)
+        is_legacy = Models.is_deprecated(m_id)
         for region in data.get("regions", []):
             if condition(m_id, data, region, is_legacy):
                 return m_id, model, region, data
@@ -80,7 +84,7 @@ def test_fluent_global_cris():
     assert global_id == f"global.{model}"
 
 def test_legacy_model_fluent():
-    """Test that legacy models (descriptors) also support fluent API."""
+    """Test that legacy models also support fluent API."""
     def condition(m_id, data, region, is_legacy):
         if not is_legacy:
             return False
@@ -92,11 +96,7 @@ def test_legacy_model_fluent():
     if not model:
         pytest.skip("No legacy model found with geo-CRIS support.")
 
-    attr_name = None
-    for name, attr in vars(Models).items():
-        if isinstance(attr, _DeprecatedModelDescriptor) and attr.model_id == m_id:
-            attr_name = name
-            break
+    attr_name = next(name for name, legacy_model in model_constants() if legacy_model == m_id)
             
     with pytest.warns(DeprecationWarning):
         legacy_model = getattr(Models, attr_name)
@@ -121,3 +121,93 @@ def test_fluent_api_invalid_region():
     
     with pytest.raises(ValueError, match="not available in region"):
         model.cris(invalid_region)
+
+def test_model_instances_are_interned():
+    """Test that equal model IDs share a single BedrockModel instance."""
+    model = Models.AMAZON_NOVA_PRO
+    assert BedrockModel(str(model)) is model
+    assert type(str(model)) is str
+    assert repr(model) == repr(model._sid)
+    assert pickle.loads(pickle.dumps(model)) is model
+
+def test_fluent_cris_is_memoized():
+    """Test that repeated .cris() calls with an explicit region hit the cache."""
+    clear_caches()
+    model = Models.ANTHROPIC_CLAUDE_SONNET_4_5_20250929
+    assert model.cris("us-east-1") == model.cris("us-east-1")
+    assert _cris_cached.cache_info().hits == 1
+
+    clear_caches()
+    assert _cris_cached.cache_info().currsize == 0
+
+
+def test_deprecation_warning_emitted_once():
+    """Test that a deprecated constant warns once per location under the default filter."""
+    name = deprecated_constant_name()
+
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter("default")
+        models = [getattr(Models, name) for _ in range(3)]
+    assert [w.category for w in record] == [DeprecationWarning]
+    assert models[0] is models[1] is models[2]
+
+    # Changing the filters re-arms the warning
+    with pytest.warns(DeprecationWarning):
+        getattr(Models, name)
+
+
+@pytest.mark.parametrize("attr, expected", [
+    ("ANTHROPIC_CLAUDE_3_7_SONNET_20250219", "anthropic.claude-3-7-sonnet-20250219-v1:0"),
+    ("ANTHROPIC_CLAUDE_SONNET_4_5_20250929", "anthropic.claude-sonnet-4-5-20250929-v1:0"),
+])
+def test_active_model_no_deprecation_warning(attr, expected):
+    """Test that accessing an active model does not warn."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert getattr(Models, attr) == expected
+
+
+def test_is_deprecated():
+    """Test the deprecation lookup by model ID."""
+    legacy_id = dict(model_constants())[deprecated_constant_name()]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert Models.is_deprecated(legacy_id)
+        assert not Models.is_deprecated(Models.AMAZON_NOVA_PRO)
+        assert not Models.is_deprecated("invalid.model")
+
+
+def test_module_level_constants():
+    """Test that Models constants are also reachable as module attributes."""
+    assert bedrock_model_ids.AMAZON_NOVA_PRO is Models.AMAZON_NOVA_PRO
+    assert "AMAZON_NOVA_PRO" in vars(bedrock_model_ids)
+
+    name = deprecated_constant_name()
+    with pytest.warns(DeprecationWarning):
+        getattr(bedrock_model_ids, name)
+    assert name not in vars(bedrock_model_ids)
+
+    with pytest.raises(AttributeError):
+        bedrock_model_ids.NOT_A_MODEL
+
+
+def test_available_regions_property():
+    """Test the cached, sorted available_regions property."""
+    model = Models.AMAZON_NOVA_PRO
+    regions = model.available_regions
+
+    assert isinstance(regions, tuple)
+    assert list(regions) == sorted(get_available_regions(model))
+    assert model.available_regions is regions
+
+
+def test_as_str():
+    """Test conversion of a model constant to a plain str."""
+    model = Models.AMAZON_NOVA_PRO
+    model_id = Models.as_str(model)
+
+    assert type(model_id) is str
+    assert model_id == model
+    assert Models.as_str("amazon.nova-pro-v1:0") == model_id
+
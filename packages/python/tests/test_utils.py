@@ -1,7 +1,30 @@
 """Tests for utility functions."""
 
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
-from bedrock_models import Models, is_model_available, get_available_regions
+from bedrock_models import (
+    Models,
+    clear_caches,
+    cris_model_id,
+    get_available_regions,
+    get_inference_profiles,
+    get_inference_types,
+    global_model_id,
+    has_global_profile,
+    is_model_available,
+    resolve_endpoint,
+    utils,
+)
+
+# The scanner script lives outside the package; its tests import it from here
+UTILS_DIR = str(Path(__file__).parent.parent / "utils")
+if UTILS_DIR not in sys.path:
+    sys.path.append(UTILS_DIR)
 
 
 def test_is_model_available():
@@ -18,9 +41,6 @@ def test_is_model_available_invalid():
 
 def test_is_model_available_without_region():
     """Test is_model_available without region (should use boto3)."""
-    from unittest.mock import patch
-    from bedrock_models import utils
-    
     # Mock _get_region_from_boto3 to return None
     with patch.object(utils, '_get_region_from_boto3', return_value=None):
         with pytest.raises(ValueError, match="Region must be provided"):
@@ -41,10 +61,21 @@ def test_get_available_regions_invalid():
         get_available_regions("invalid.model-id")
 
 
+def test_model_data_is_loaded_once():
+    """Test that lookups share one parsed copy of the model data."""
+    clear_caches()
+    with patch.object(utils, 'load_model_data', wraps=utils.load_model_data) as load:
+        model_id = Models.AMAZON_NOVA_PRO
+        regions = get_available_regions(model_id)
+        regions.append("xx-test-1")
+        assert "xx-test-1" not in get_available_regions(model_id)
+        assert is_model_available(model_id, regions[0])
+        assert load.call_count == 1
+    clear_caches()
+
+
 def test_has_global_profile():
     """Test checking for global inference profile."""
-    from bedrock_models import has_global_profile
-    
     # Test with a model that might have global profile
     model_id = Models.ANTHROPIC_CLAUDE_SONNET_4_5_20250929
     regions = get_available_regions(model_id)
@@ -56,8 +87,6 @@ def test_has_global_profile():
 
 def test_cris_model_id():
     """Test getting CRIS model ID (geo or global)."""
-    from bedrock_models import cris_model_id
-    
     model_id = Models.ANTHROPIC_CLAUDE_SONNET_4_5_20250929
     
     # Test with explicit region
@@ -68,8 +97,6 @@ def test_cris_model_id():
 
 def test_cris_model_id_on_demand():
     """Test getting CRIS model ID (geo or global)."""
-    from bedrock_models import cris_model_id
-    
     model_id = Models.AMAZON_NOVA_LITE
     
     # Test with explicit region
@@ -80,8 +107,6 @@ def test_cris_model_id_on_demand():
 
 def test_cris_model_id_global():
     """Test getting CRIS model ID (geo or global)."""
-    from bedrock_models import cris_model_id
-    
     model_id = Models.AMAZON_NOVA_2_LITE
     
     # Test with explicit region
@@ -92,10 +117,6 @@ def test_cris_model_id_global():
 
 def test_cris_model_id_without_region():
     """Test CRIS model ID without region (should use boto3)."""
-    from bedrock_models import cris_model_id
-    from unittest.mock import patch
-    from bedrock_models import utils
-    
     # Mock _get_region_from_boto3 to return None
     with patch.object(utils, '_get_region_from_boto3', return_value=None):
         with pytest.raises(ValueError, match="Region must be provided"):
@@ -104,8 +125,6 @@ def test_cris_model_id_without_region():
 
 def test_global_model_id():
     """Test getting global model ID."""
-    from bedrock_models import global_model_id
-    
     model_id = Models.ANTHROPIC_CLAUDE_SONNET_4_5_20250929
     regions = get_available_regions(model_id)
     
@@ -123,20 +142,31 @@ def test_global_model_id():
 
 def test_global_model_id_without_region():
     """Test global model ID without region (should use boto3)."""
-    from bedrock_models import global_model_id
-    from unittest.mock import patch
-    from bedrock_models import utils
-    
     # Mock _get_region_from_boto3 to return None
     with patch.object(utils, '_get_region_from_boto3', return_value=None):
         with pytest.raises(ValueError, match="Region must be provided"):
             global_model_id(Models.ANTHROPIC_CLAUDE_SONNET_4_5_20250929)
 
 
+
+def test_resolve_endpoint():
+    """Test resolving the best endpoint in a single lookup."""
+    model_id = Models.ANTHROPIC_CLAUDE_SONNET_4_5_20250929
+    assert resolve_endpoint(model_id, "us-east-1") == (cris_model_id(model_id, "us-east-1"), "cris")
+    assert resolve_endpoint(model_id, "us-east-1", prefer_global=True) == (f"global.{model_id}", "global")
+    assert resolve_endpoint(Models.AMAZON_NOVA_LITE, "us-east-1") == (
+        f"us.{Models.AMAZON_NOVA_LITE}",
+        "cris",
+    )
+    assert resolve_endpoint("ai21.jamba-1-5-large-v1:0", "us-east-1") == (
+        "ai21.jamba-1-5-large-v1:0",
+        "direct",
+    )
+    assert resolve_endpoint("invalid.model", "us-east-1") == ("invalid.model", "unavailable")
+    assert Models.AMAZON_NOVA_LITE.resolve("us-east-1")[1] == "cris"
+
 def test_ca_central_1_inference_profiles():
     """Test inference profiles in ca-central-1 region."""
-    from bedrock_models import get_inference_profiles, get_inference_types, cris_model_id
-    
     model_id = Models.ANTHROPIC_CLAUDE_SONNET_4_5_20250929
     region = "ca-central-1"
     
@@ -161,8 +191,6 @@ def test_ca_central_1_inference_profiles():
 
 def test_me_central_1_inference_profiles():
     """Test inference profiles in me-central-1 region."""
-    from bedrock_models import get_inference_profiles, get_inference_types, cris_model_id
-    
     model_id = Models.ANTHROPIC_CLAUDE_SONNET_4_20250514
     region = "me-central-1"
     
@@ -186,16 +214,6 @@ def test_me_central_1_inference_profiles():
 
 def test_save_to_json_metadata(tmp_path):
     """Test save_to_json updates bedrock_models_metadata.json correctly."""
-    import sys
-    import json
-    from pathlib import Path
-    from datetime import datetime, timezone
-    
-    # Add utils path to sys.path
-    utils_dir = str(Path(__file__).parent.parent / "utils")
-    if utils_dir not in sys.path:
-        sys.path.append(utils_dir)
-        
     from generate_models_json import save_to_json
     
     models_file = tmp_path / "bedrock_models.json"
@@ -206,14 +224,14 @@ def test_save_to_json_metadata(tmp_path):
         "model-a": {
             "regions": ["us-east-1"],
             "inference_types": {"us-east-1": ["ON_DEMAND"]},
-            "inputModalities": {"TEXT"},
-            "outputModalities": {"TEXT"},
+            "inputModalities": ["TEXT"],
+            "outputModalities": ["TEXT"],
         },
         "model-b": {
             "regions": ["us-west-2"],
             "inference_types": {"us-west-2": ["ON_DEMAND"]},
-            "inputModalities": {"TEXT"},
-            "outputModalities": {"TEXT"},
+            "inputModalities": ["TEXT"],
+            "outputModalities": ["TEXT"],
         }
     }
     
@@ -249,14 +267,14 @@ def test_save_to_json_metadata(tmp_path):
         "model-a": {
             "regions": ["us-east-1"],
             "inference_types": {"us-east-1": ["ON_DEMAND"]},
-            "inputModalities": {"TEXT"},
-            "outputModalities": {"TEXT"},
+            "inputModalities": ["TEXT"],
+            "outputModalities": ["TEXT"],
         },
         "model-b": {
             "regions": ["us-west-2", "us-east-1"], # Changed regions list
             "inference_types": {"us-west-2": ["ON_DEMAND"], "us-east-1": ["ON_DEMAND"]},
-            "inputModalities": {"TEXT"},
-            "outputModalities": {"TEXT"},
+            "inputModalities": ["TEXT"],
+            "outputModalities": ["TEXT"],
         }
     }
     save_to_json(modified_mapping, filename=str(models_file))
@@ -278,8 +296,8 @@ def test_save_to_json_metadata(tmp_path):
         "model-a": {
             "regions": ["us-east-1"],
             "inference_types": {"us-east-1": ["ON_DEMAND"]},
-            "inputModalities": {"TEXT"},
-            "outputModalities": {"TEXT"},
+            "inputModalities": ["TEXT"],
+            "outputModalities": ["TEXT"],
         }
     }
     save_to_json(deleted_mapping, filename=str(models_file))
@@ -307,13 +325,6 @@ def test_save_to_json_metadata(tmp_path):
 
 def test_merge_failed_regions_from_previous():
     """Test preserving previous state when a region API fails during scanning."""
-    import sys
-    from pathlib import Path
-    
-    utils_dir = str(Path(__file__).parent.parent / "utils")
-    if utils_dir not in sys.path:
-        sys.path.append(utils_dir)
-        
     from generate_models_json import merge_failed_regions_from_previous
     
     old_models = {
@@ -368,7 +379,7 @@ def test_merge_failed_regions_from_previous():
 
     # Verify model-a restored ON_DEMAND in ap-southeast-4
     assert "ON_DEMAND" in current_sorted_mapping["model-a"]["inference_types"]["ap-southeast-4"]
-    assert current_sorted_mapping["model-a"]["inference_types"]["ap-southeast-4"] == ["AU", "GLOBAL", "ON_DEMAND"]
+    assert current_sorted_mapping["model-a"]["inference_types"]["ap-southeast-4"] == ("AU", "GLOBAL", "ON_DEMAND")
 
     # Verify mantle_supported_regions restored for model-a
     assert "mantle_supported_regions" in current_sorted_mapping["model-a"]
@@ -377,19 +388,11 @@ def test_merge_failed_regions_from_previous():
 
     # Verify model-b-regional-only was fully restored
     assert "model-b-regional-only" in current_sorted_mapping
-    assert current_sorted_mapping["model-b-regional-only"]["regions"] == ["ap-southeast-4"]
+    assert current_sorted_mapping["model-b-regional-only"]["regions"] == ("ap-southeast-4",)
 
 
 def test_save_to_json_with_failed_regions(tmp_path):
     """Test save_to_json integrates merge_failed_regions_from_previous and avoids false last_changed updates."""
-    import sys
-    import json
-    from pathlib import Path
-    
-    utils_dir = str(Path(__file__).parent.parent / "utils")
-    if utils_dir not in sys.path:
-        sys.path.append(utils_dir)
-        
     from generate_models_json import save_to_json
 
     models_file = tmp_path / "bedrock_models.json"
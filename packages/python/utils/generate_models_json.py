@@ -5,14 +5,16 @@ Maps each unique model ID to the list of regions where it's supported and the in
 Uses ThreadPoolExecutor for parallel processing to speed up scanning.
 """
 
+import argparse
 import boto3
+import functools
 import json
 import logging
 import socket
+import sys
 import time
-from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Set, Any
+from typing import Dict, List, Set, Tuple, Any
 import threading
 import urllib.request
 import urllib.error
@@ -20,12 +22,43 @@ from botocore.config import Config
 from botocore.exceptions import ReadTimeoutError, ConnectTimeoutError, ClientError
 from aws_bedrock_token_generator import provide_token
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
 # Disable boto3's built-in retries so retry_on_timeout is the single, uniform
-# retry layer (exponential backoff) across every API call.
-BEDROCK_CLIENT_CONFIG = Config(retries={'max_attempts': 1})
+# retry layer (exponential backoff) across every API call. The connection pool
+# is sized above botocore's default of 10 so concurrent calls on a shared client
+# reuse kept-alive connections instead of reopening them.
+BEDROCK_CLIENT_CONFIG = Config(
+    retries={'max_attempts': 1},
+    max_pool_connections=50,
+    tcp_keepalive=True,
+)
+
+# One session shared by every worker thread: each implicit boto3.client() call
+# would otherwise load the endpoint and service model data again. Creating
+# clients from a session is not thread-safe, so it is serialized by a lock;
+# API calls on the resulting clients still run concurrently.
+_SESSION = boto3.session.Session()
+_CLIENT_LOCK = threading.Lock()
+
+# Bedrock clients by region, so the model and profile listings of a region share
+# one client. A plain dict rather than a WeakValueDictionary: the helpers drop
+# their client between calls, so weak entries would be gone before reuse.
+_CLIENTS: Dict[str, Any] = {}
+
+# Shared by every region for the per-profile get_inference_profile calls, which
+# bounds the total number of in-flight detail requests across the scan.
+_DETAIL_POOL = ThreadPoolExecutor(max_workers=32)
+
+# Inference types that make a model usable without provisioned throughput;
+# models supporting none of them are dropped from the scan.
+_KEEP_TYPES = frozenset({'ON_DEMAND', 'INFERENCE_PROFILE'})
 
 # Exception types that represent a timeout worth retrying.
 _TIMEOUT_EXCEPTIONS = (socket.timeout, TimeoutError, ReadTimeoutError, ConnectTimeoutError)
@@ -48,9 +81,15 @@ def _is_retryable(exc: Exception) -> bool:
     return False
 
 
-def make_bedrock_client(region: str):
-    """Create a Bedrock client with internal retries disabled."""
-    return boto3.client('bedrock', region_name=region, config=BEDROCK_CLIENT_CONFIG)
+def get_bedrock_client(region: str):
+    """Return the cached Bedrock client for a region, creating it with internal retries disabled."""
+    with _CLIENT_LOCK:
+        client = _CLIENTS.get(region)
+        if client is None:
+            client = _CLIENTS[region] = _SESSION.client(
+                'bedrock', region_name=region, config=BEDROCK_CLIENT_CONFIG
+            )
+        return client
 
 
 def retry_on_timeout(func, *args, max_retries: int = 3, base_delay: float = 1.0,
@@ -86,10 +125,10 @@ def retry_on_timeout(func, *args, max_retries: int = 3, base_delay: float = 1.0,
     raise last_exc
 
 
-def get_bedrock_regions() -> List[str]:
-    """Get regions where Bedrock service is available."""
-    session = boto3.Session()
-    return session.get_available_regions('bedrock')
+@functools.lru_cache(maxsize=None)
+def get_bedrock_regions() -> Tuple[str, ...]:
+    """Get regions where Bedrock service is available (read from botocore's endpoint data once)."""
+    return tuple(_SESSION.get_available_regions('bedrock'))
 
 
 def get_foundation_models_in_region(region: str) -> tuple[str, List[Dict] | None]:
@@ -103,17 +142,43 @@ def get_foundation_models_in_region(region: str) -> tuple[str, List[Dict] | None
         Tuple of (region, list of model dictionaries or None on failure)
     """
     try:
-        bedrock = make_bedrock_client(region)
+        bedrock = get_bedrock_client(region)
+        # ListFoundationModels is not paginated: one call returns every model
         response = retry_on_timeout(
             bedrock.list_foundation_models,
             description=f"list_foundation_models in {region}",
         )
         return region, response.get('modelSummaries', [])
     except Exception as e:
-        print(f"Error accessing region {region}: {e}")
+        logger.error("Error accessing region %s: %s", region, e)
         return region, None
 
 
+def _list_inference_profile_summaries(bedrock) -> List[Dict]:
+    """Collect the inference profile summaries from every page of results."""
+    paginator = bedrock.get_paginator('list_inference_profiles')
+    return [
+        profile
+        for page in paginator.paginate(PaginationConfig={'PageSize': 1000})
+        for profile in page.get('inferenceProfileSummaries', [])
+    ]
+
+
+def _covered_regions(models: List[Dict] | None) -> Set[str]:
+    """Extract the region names from the model ARNs of an inference profile."""
+    covered_regions = set()
+    for model in models or ():
+        # Arn format: arn:aws:bedrock:REGION::...
+        arn = model.get('modelArn', '')
+        if ':' in arn:
+            arn_parts = arn.split(':', 4)
+            if len(arn_parts) > 3:
+                region_part = arn_parts[3]
+                if region_part:
+                    covered_regions.add(region_part)
+    return covered_regions
+
+
 def get_inference_profiles_in_region(region: str) -> Dict[str, Dict[str, List[str]]] | None:
     """
     Get all inference profiles available in a specific region and their covered regions.
@@ -126,56 +191,55 @@ def get_inference_profiles_in_region(region: str) -> Dict[str, Dict[str, List[st
         Dictionary mapping model IDs to profile info or None on failure
     """
     try:
-        bedrock = make_bedrock_client(region)
-        response = retry_on_timeout(
-            bedrock.list_inference_profiles,
+        bedrock = get_bedrock_client(region)
+        # A retry restarts the listing from the first page
+        profile_summaries = retry_on_timeout(
+            _list_inference_profile_summaries,
+            bedrock,
             description=f"list_inference_profiles in {region}",
         )
         
         # Structure: model_id -> {prefix -> [regions]}
-        model_profiles = defaultdict(lambda: defaultdict(list))
+        model_profiles: Dict[str, Dict[str, List[str]]] = {}
         
-        for profile in response.get('inferenceProfileSummaries', []):
+        # Covered regions come from the summary's model ARNs; the detail call is
+        # only made (concurrently) for profiles whose summary lists no models
+        future_to_profile = {}
+        for profile in profile_summaries:
             profile_id = profile.get('inferenceProfileId', '')
             
             # Extract prefix from profile ID (e.g., "us.anthropic...:0" -> "US")
-            if '.' in profile_id:
-                parts = profile_id.split('.')
-                prefix = parts[0].upper()
-                model_id = '.'.join(parts[1:])
-                
-                # Fetch detailed profile info to get covered regions
-                try:
-                    details = retry_on_timeout(
-                        bedrock.get_inference_profile,
-                        inferenceProfileIdentifier=profile_id,
-                        description=f"get_inference_profile {profile_id} in {region}",
-                    )
-                    covered_regions = set()
-                    
-                    for model in details.get('models', []):
-                        # Arn format: arn:aws:bedrock:REGION::...
-                        arn = model.get('modelArn', '')
-                        if ':' in arn:
-                            arn_parts = arn.split(':')
-                            if len(arn_parts) > 3:
-                                region_part = arn_parts[3]
-                                if region_part:
-                                    covered_regions.add(region_part)
+            prefix, sep, model_id = profile_id.partition('.')
+            if not sep:
+                continue
+            prefix = prefix.upper()
+            covered_regions = _covered_regions(profile.get('models'))
+            if covered_regions:
+                model_profiles.setdefault(model_id, {})[prefix] = sorted(covered_regions)
+                continue
+            future = _DETAIL_POOL.submit(
+                retry_on_timeout,
+                bedrock.get_inference_profile,
+                inferenceProfileIdentifier=profile_id,
+                description=f"get_inference_profile {profile_id} in {region}",
+            )
+            future_to_profile[future] = (profile_id, prefix, model_id)
+        
+        for future in as_completed(future_to_profile):
+            profile_id, prefix, model_id = future_to_profile[future]
+            try:
+                covered_regions = _covered_regions(future.result().get('models'))
+                if covered_regions:
+                    model_profiles.setdefault(model_id, {})[prefix] = sorted(covered_regions)
                     
-                    if covered_regions:
-                        model_profiles[model_id][prefix] = sorted(list(covered_regions))
-                        
-                except Exception as e:
-                    # If we can't get details, just record the prefix exists (backward compatibility)
-                    print(f"    ⚠ Could not get details for profile {profile_id}: {e}")
-                    if prefix not in model_profiles[model_id]:
-                        model_profiles[model_id][prefix] = []
-
-        # Convert to standard dict for return
-        return {k: dict(v) for k, v in model_profiles.items()}
+            except Exception as e:
+                # If we can't get details, just record the prefix exists (backward compatibility)
+                logger.warning("Could not get details for profile %s: %s", profile_id, e)
+                model_profiles.setdefault(model_id, {}).setdefault(prefix, [])
+
+        return model_profiles
     except Exception as e:
-        print(f"  Error listing inference profiles in {region}: {e}")
+        logger.error("Error listing inference profiles in %s: %s", region, e)
         return None
 
 
@@ -190,7 +254,7 @@ def get_mantle_models_in_region(region: str) -> Dict[str, List[str]]:
     try:
         token = provide_token(region=region)
     except Exception as e:
-        print(f"  ⚠ Could not generate Mantle token for {region}: {e}")
+        logger.warning("Could not generate Mantle token for %s: %s", region, e)
         return {}
         
     url_models = f"https://bedrock-mantle.{region}.api.aws/v1/models"
@@ -209,7 +273,7 @@ def get_mantle_models_in_region(region: str) -> Dict[str, List[str]]:
             model_ids = [m['id'] for m in data.get('data', [])]
     except Exception as exc:
         if _is_retryable(exc):
-            print(f"  ⚠ Mantle endpoint error/timeout in {region}: {exc}")
+            logger.warning("Mantle endpoint error/timeout in %s: %s", region, exc)
             return None
         # If the endpoint doesn't exist or isn't reachable (e.g. host name unresolved), return empty dict
         return {}
@@ -345,59 +409,75 @@ def process_region(region: str) -> tuple[str, List[Dict], Dict[str, Dict[str, Li
     Returns:
         Tuple of (region, filtered_models, model_to_profiles, excluded_count, mantle_model_apis, failed)
     """
-    print(f"Scanning region: {region}")
+    logger.info("Scanning region: %s", region)
     failed = False
     
     region_name, models = get_foundation_models_in_region(region)
     if models is None:
-        print(f"  ⚠ Failed to fetch foundation models in {region}")
+        logger.warning("Failed to fetch foundation models in %s", region)
         models = []
         failed = True
     else:
-        print(f"  Found {len(models)} models in {region}")
+        logger.info("Found %d models in %s", len(models), region)
     
     # Filter models immediately - only keep those with ON_DEMAND or INFERENCE_PROFILE
     filtered_models = []
     excluded_count = 0
     
     for model in models:
-        inference_types = model.get('inferenceTypesSupported', [])
-        if 'ON_DEMAND' in inference_types or 'INFERENCE_PROFILE' in inference_types:
+        inference_types = model.get('inferenceTypesSupported', ())
+        if not _KEEP_TYPES.isdisjoint(inference_types):
             filtered_models.append(model)
         else:
             excluded_count += 1
-            model_id = model.get('modelId', 'unknown')
-#            print(f"    ⓧ Excluding {model_id} (only PROVISIONED)")
+            logger.debug("Excluding %s (only PROVISIONED)", model.get('modelId', 'unknown'))
     
-    print(f"  Kept {len(filtered_models)} models after filtering")
+    logger.info("Kept %d models in %s after filtering", len(filtered_models), region)
     
     # Get all inference profiles in this region
     model_to_profiles = get_inference_profiles_in_region(region)
     if model_to_profiles is None:
-        print(f"  ⚠ Failed to fetch inference profiles in {region}")
+        logger.warning("Failed to fetch inference profiles in %s", region)
         model_to_profiles = {}
         failed = True
     elif model_to_profiles:
         count = sum(len(profiles) for profiles in model_to_profiles.values())
-        print(f"  Found {count} profile definitions")
+        logger.info("Found %d profile definitions in %s", count, region)
         
     # Get all Bedrock Mantle models and their supported APIs
-    print(f"  Probing Bedrock Mantle models in {region}...")
+    logger.info("Probing Bedrock Mantle models in %s...", region)
     mantle_model_apis = get_mantle_models_in_region(region)
     if mantle_model_apis is None:
-        print(f"  ⚠ Failed to probe Mantle models in {region}")
+        logger.warning("Failed to probe Mantle models in %s", region)
         mantle_model_apis = {}
         failed = True
     else:
-        print(f"  Found {len(mantle_model_apis)} Mantle-supported models in {region}")
+        logger.info("Found %d Mantle-supported models in %s", len(mantle_model_apis), region)
         
     if not failed and len(filtered_models) == 0 and len(model_to_profiles) == 0 and len(mantle_model_apis) == 0:
-        print(f"  ⚠ Region {region} returned 0 models across all APIs; marking as failed.")
+        logger.warning("Region %s returned 0 models across all APIs; marking as failed.", region)
         failed = True
     
     return region, filtered_models, model_to_profiles, excluded_count, mantle_model_apis, failed
 
 
+def _new_model_entry() -> Dict[str, Any]:
+    """Return an empty model entry, filled in as regions are merged."""
+    return {
+        'regions': set(), 
+        'inference_types': {}, 
+        'model_lifecycle_status': 'ACTIVE',
+        'inferenceProfile': {},
+        'inputModalities': set(),
+        'outputModalities': set(),
+        'responseStreamingSupported': None,
+        'customizationsSupported': set(),
+        'mantle_supported_regions': set(),
+        'mantle_apis': [],
+        'runtime_supported': False
+    }
+
+
 def scan_all_regions_parallel() -> tuple[Dict[str, Any], Set[str]]:
     """
     Scan all AWS regions in parallel and build a mapping of model IDs to regions and inference types.
@@ -410,26 +490,17 @@ def scan_all_regions_parallel() -> tuple[Dict[str, Any], Set[str]]:
     print(f"Regions: {', '.join(bedrock_regions)}\n")
     
     # Structure: model_id -> {regions, inference_types, ...}
-    model_mapping = defaultdict(lambda: {
-        'regions': [], 
-        'inference_types': {}, 
-        'model_lifecycle_status': 'ACTIVE',
-        'inferenceProfile': {},
-        'inputModalities': set(),
-        'outputModalities': set(),
-        'responseStreamingSupported': None,
-        'customizationsSupported': set(),
-        'mantle_supported_regions': [],
-        'mantle_apis': [],
-        'runtime_supported': False
-    })
+    model_mapping: Dict[str, Dict[str, Any]] = {}
     
     failed_regions = set()
     total_excluded = 0
-    lock = threading.Lock()
     
-    # Process all regions in parallel
-    with ThreadPoolExecutor(max_workers=10) as executor:
+    # The scan is I/O bound: give every region its own worker, up to a cap
+    max_workers = min(len(bedrock_regions), 32) or 1
+
+    # Process all regions in parallel; results are merged here, on the single
+    # thread consuming as_completed, so the workers share no state
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
         future_to_region = {executor.submit(process_region, region): region for region in bedrock_regions}
         
         for future in as_completed(future_to_region):
@@ -437,111 +508,113 @@ def scan_all_regions_parallel() -> tuple[Dict[str, Any], Set[str]]:
             try:
                 region_name, models, model_to_profiles, excluded_count, mantle_model_apis, failed = future.result()
                 
-                with lock:
-                    if failed:
-                        failed_regions.add(region)
-                        
-                    total_excluded += excluded_count
+                if failed:
+                    failed_regions.add(region)
                     
-                    for model in models:
-                        model_id = model.get('modelId')
-                        if not model_id:
-                            continue
-                        
-                        model_lifecycle_status = model.get('modelLifecycle', {}).get('status', 'ACTIVE')
-                        model_mapping[model_id]['runtime_supported'] = True
-                        
-                        # Add region
-                        if region not in model_mapping[model_id]['regions']:
-                            model_mapping[model_id]['regions'].append(region)
-                        
-                        # Store lifecycle status
-                        if model_mapping[model_id]['model_lifecycle_status'] == 'ACTIVE':
-                            model_mapping[model_id]['model_lifecycle_status'] = model_lifecycle_status
-                            if model_lifecycle_status == 'LEGACY':
-                                print(f"    ⚠ LEGACY model: {model_id}")
-                        
-                        # Capture modalities, streaming, and customizations
-                        input_modalities = model.get('inputModalities', [])
-                        output_modalities = model.get('outputModalities', [])
-                        streaming_supported = model.get('responseStreamingSupported', False)
-                        customizations = model.get('customizationsSupported', [])
-                        
-                        model_mapping[model_id]['inputModalities'].update(input_modalities)
-                        model_mapping[model_id]['outputModalities'].update(output_modalities)
+                total_excluded += excluded_count
+                
+                for model in models:
+                    model_id = model.get('modelId')
+                    if not model_id:
+                        continue
+                    
+                    entry = model_mapping.get(model_id)
+                    if entry is None:
+                        entry = model_mapping[model_id] = _new_model_entry()
+                    model_lifecycle_status = model.get('modelLifecycle', {}).get('status', 'ACTIVE')
+                    entry['runtime_supported'] = True
+                    
+                    # Add region
+                    entry['regions'].add(region)
+                    
+                    # Store lifecycle status
+                    if entry['model_lifecycle_status'] == 'ACTIVE':
+                        entry['model_lifecycle_status'] = model_lifecycle_status
+                        if model_lifecycle_status == 'LEGACY':
+                            logger.info("⚠ LEGACY model: %s", model_id)
+                    
+                    # Capture modalities, streaming, and customizations
+                    input_modalities = model.get('inputModalities', [])
+                    output_modalities = model.get('outputModalities', [])
+                    streaming_supported = model.get('responseStreamingSupported', False)
+                    customizations = model.get('customizationsSupported', [])
+                    
+                    entry['inputModalities'].update(input_modalities)
+                    entry['outputModalities'].update(output_modalities)
+                    
+                    # Set streaming to True if any region supports it
+                    if streaming_supported:
+                        entry['responseStreamingSupported'] = True
+                    elif entry['responseStreamingSupported'] is None:
+                        entry['responseStreamingSupported'] = False
+                    
+                    entry['customizationsSupported'].update(customizations)
+                    
+                    # Get base inference types from the model
+                    supported_types = model.get('inferenceTypesSupported', ())
+                    has_profile = 'INFERENCE_PROFILE' in supported_types
+                    
+                    # Replace INFERENCE_PROFILE with actual profile prefixes
+                    if has_profile:
+                        # Remove the generic INFERENCE_PROFILE
+                        inference_types = [t for t in supported_types if t != 'INFERENCE_PROFILE']
                         
-                        # Set streaming to True if any region supports it
-                        if streaming_supported:
-                            model_mapping[model_id]['responseStreamingSupported'] = True
-                        elif model_mapping[model_id]['responseStreamingSupported'] is None:
-                            model_mapping[model_id]['responseStreamingSupported'] = False
+                        # Add the actual profile prefixes for this model
+                        # model_to_profiles is {model_id: {prefix: [regions]}}
+                        profiles = model_to_profiles.get(model_id)
+                        if profiles:
+                            inference_types.extend(profiles)
+                            
+                            # Update global inferenceProfile registry for this model
+                            inference_profile = entry['inferenceProfile']
+                            for prefix, covered_regions in profiles.items():
+                                if prefix == 'GLOBAL':
+                                    # GLOBAL is the set of all regions covered across all source regions
+                                    inference_profile.setdefault('GLOBAL', set()).update(covered_regions)
+                                else:
+                                    # Regional profiles are now keyed by Source Region
+                                    # Structure: prefix -> { source_region -> [covered_regions] }
+                                    # Current 'region' is the source region; the list is already
+                                    # sorted and is only frozen (by _sorted_entry) on the way out
+                                    inference_profile.setdefault(prefix, {})[region] = covered_regions
+                    else:
+                        # Copied, since the Mantle merge below may append to it
+                        inference_types = list(supported_types)
+
+                    # Store inference types for this region
+                    entry['inference_types'][region] = inference_types
+                    
+                # Merge mantle models and their supported APIs
+                for m, apis in mantle_model_apis.items():
+                    # Handle Mantle-only models by initializing with defaults
+                    entry = model_mapping.get(m)
+                    if entry is None:
+                        entry = model_mapping[m] = _new_model_entry()
+                        entry['model_lifecycle_status'] = 'ACTIVE'
+                        entry['inputModalities'] = {'TEXT'}
+                        # Special handling: if model name hints multimodal, add IMAGE/VIDEO
+                        if any(kw in m.lower() for kw in ['-vl', '-vision', 'canvas', 'multimodal']):
+                            entry['inputModalities'].update(['IMAGE', 'VIDEO'])
+                        entry['outputModalities'] = {'TEXT'}
+                        entry['responseStreamingSupported'] = True
                         
-                        model_mapping[model_id]['customizationsSupported'].update(customizations)
+                    # Add region to standard regions
+                    entry['regions'].add(region)
                         
-                        # Get base inference types from the model
-                        inference_types = list(model.get('inferenceTypesSupported', []))
+                    # Ensure it has ON_DEMAND in inference_types for this region
+                    if region not in entry['inference_types']:
+                        entry['inference_types'][region] = ['ON_DEMAND']
+                    elif 'ON_DEMAND' not in entry['inference_types'][region]:
+                        entry['inference_types'][region].append('ON_DEMAND')
                         
-                        # Replace INFERENCE_PROFILE with actual profile prefixes
-                        if 'INFERENCE_PROFILE' in inference_types:
-                            # Remove the generic INFERENCE_PROFILE
-                            inference_types = [t for t in inference_types if t != 'INFERENCE_PROFILE']
-                            
-                            # Add the actual profile prefixes for this model
-                            if model_id in model_to_profiles:
-                                # model_to_profiles is now {model_id: {prefix: [regions]}}
-                                prefixes = list(model_to_profiles[model_id].keys())
-                                inference_types.extend(prefixes)
-                                
-                                # Update global inferenceProfile registry for this model
-                                for prefix, covered_regions in model_to_profiles[model_id].items():
-                                    if prefix == 'GLOBAL':
-                                        # GLOBAL is a list of all regions covered across all source regions
-                                        existing = set(model_mapping[model_id]['inferenceProfile'].get('GLOBAL', []))
-                                        existing.update(covered_regions)
-                                        model_mapping[model_id]['inferenceProfile']['GLOBAL'] = sorted(list(existing))
-                                    else:
-                                        # Regional profiles are now keyed by Source Region
-                                        # Structure: prefix -> { source_region -> [covered_regions] }
-                                        if prefix not in model_mapping[model_id]['inferenceProfile']:
-                                            model_mapping[model_id]['inferenceProfile'][prefix] = {}
-                                        
-                                        # Current 'region' is the source region
-                                        model_mapping[model_id]['inferenceProfile'][prefix][region] = sorted(list(covered_regions))
-
-                        # Store inference types for this region
-                        model_mapping[model_id]['inference_types'][region] = inference_types
+                    # Add region to mantle_supported_regions
+                    entry['mantle_supported_regions'].add(region)
                         
-                    # Merge mantle models and their supported APIs
-                    for m, apis in mantle_model_apis.items():
-                        # Handle Mantle-only models by initializing with defaults
-                        if m not in model_mapping:
-                            model_mapping[m]['model_lifecycle_status'] = 'ACTIVE'
-                            model_mapping[m]['inputModalities'] = {'TEXT'}
-                            # Special handling: if model name hints multimodal, add IMAGE/VIDEO
-                            if any(kw in m.lower() for kw in ['-vl', '-vision', 'canvas', 'multimodal']):
-                                model_mapping[m]['inputModalities'].update(['IMAGE', 'VIDEO'])
-                            model_mapping[m]['outputModalities'] = {'TEXT'}
-                            model_mapping[m]['responseStreamingSupported'] = True
-                            
-                        # Add region to standard regions
-                        if region not in model_mapping[m]['regions']:
-                            model_mapping[m]['regions'].append(region)
-                            
-                        # Ensure it has ON_DEMAND in inference_types for this region
-                        if region not in model_mapping[m]['inference_types']:
-                            model_mapping[m]['inference_types'][region] = ['ON_DEMAND']
-                        elif 'ON_DEMAND' not in model_mapping[m]['inference_types'][region]:
-                            model_mapping[m]['inference_types'][region].append('ON_DEMAND')
-                            
-                        # Add region to mantle_supported_regions
-                        if region not in model_mapping[m]['mantle_supported_regions']:
-                            model_mapping[m]['mantle_supported_regions'].append(region)
-                            
-                        # Merge/set mantle_apis
-                        for api in apis:
-                            if api not in model_mapping[m]['mantle_apis']:
-                                model_mapping[m]['mantle_apis'].append(api)
-                
+                    # Merge/set mantle_apis
+                    for api in apis:
+                        if api not in entry['mantle_apis']:
+                            entry['mantle_apis'].append(api)
+            
             except Exception as e:
                 print(f"Error processing region {region}: {e}")
                 failed_regions.add(region)
@@ -550,60 +623,69 @@ def scan_all_regions_parallel() -> tuple[Dict[str, Any], Set[str]]:
     if failed_regions:
         print(f"Failed regions detected during scan: {', '.join(sorted(failed_regions))}")
     
-    return dict(model_mapping), failed_regions
+    # Finalize once: the summary and save steps get sorted, JSON-ready entries
+    return {
+        model_id: _sorted_entry(model_mapping[model_id])
+        for model_id in sorted(model_mapping)
+    }, failed_regions
 
 
 def print_summary(model_mapping: Dict[str, Any]):
     """Print a summary of the model mapping."""
-    print("\n" + "="*80)
-    print("SUMMARY")
-    print("="*80)
+    # Collected and written in one go rather than one print() per line
+    out = []
+    out.append("\n" + "="*80)
+    out.append("SUMMARY")
+    out.append("="*80)
     
     legacy_count = sum(1 for data in model_mapping.values() 
                       if data.get('model_lifecycle_status') == 'LEGACY')
-    print(f"\nTotal unique models found: {len(model_mapping)}")
-    print(f"Legacy models: {legacy_count}\n")
+    out.append(f"\nTotal unique models found: {len(model_mapping)}")
+    out.append(f"Legacy models: {legacy_count}\n")
     
-    for model_id, data in sorted(model_mapping.items()):
+    # Entries come sorted from scan_all_regions_parallel, so nothing is re-sorted here
+    for model_id, data in model_mapping.items():
         regions = data['regions']
         lifecycle = data.get('model_lifecycle_status', 'ACTIVE')
         lifecycle_marker = " [LEGACY]" if lifecycle == 'LEGACY' else ""
         
-        print(f"\nModel: {model_id}{lifecycle_marker}")
-        print(f"  Available in {len(regions)} region(s): {', '.join(sorted(regions))}")
+        out.append(f"\nModel: {model_id}{lifecycle_marker}")
+        out.append(f"  Available in {len(regions)} region(s): {', '.join(regions)}")
         
         # Print modalities and capabilities
-        input_mods = sorted(list(data.get('inputModalities', set())))
-        output_mods = sorted(list(data.get('outputModalities', set())))
+        input_mods = data.get('inputModalities', [])
+        output_mods = data.get('outputModalities', [])
         streaming = data.get('responseStreamingSupported', False)
-        customizations = sorted(list(data.get('customizationsSupported', set())))
+        customizations = data.get('customizationsSupported', [])
         
-        print(f"  Input: {', '.join(input_mods) if input_mods else 'N/A'}")
-        print(f"  Output: {', '.join(output_mods) if output_mods else 'N/A'}")
-        print(f"  Streaming: {'Yes' if streaming else 'No'}")
+        out.append(f"  Input: {', '.join(input_mods) if input_mods else 'N/A'}")
+        out.append(f"  Output: {', '.join(output_mods) if output_mods else 'N/A'}")
+        out.append(f"  Streaming: {'Yes' if streaming else 'No'}")
         if customizations:
-            print(f"  Customizations: {', '.join(customizations)}")
+            out.append(f"  Customizations: {', '.join(customizations)}")
         
         # Print inference profiles if any
         if data.get('inferenceProfile'):
-            print("  Inference Profiles:")
+            out.append("  Inference Profiles:")
             for prefix, content in data['inferenceProfile'].items():
                 if prefix == 'GLOBAL':
-                    print(f"    {prefix}: {content}")
+                    out.append(f"    {prefix}: {list(content)}")
                 else:
-                    print(f"    {prefix}:")
+                    out.append(f"    {prefix}:")
                     for src, covered in content.items():
-                        print(f"      From {src}: {covered}")
+                        out.append(f"      From {src}: {list(covered)}")
                         
         # Print Mantle info if any
         if data.get('mantle_supported_regions'):
-            print(f"  Mantle Supported Regions: {', '.join(sorted(data['mantle_supported_regions']))}")
-            print(f"  Mantle Supported APIs: {', '.join(sorted(data['mantle_apis']))}")
+            out.append(f"  Mantle Supported Regions: {', '.join(data['mantle_supported_regions'])}")
+            out.append(f"  Mantle Supported APIs: {', '.join(data['mantle_apis'])}")
         
-        print(f"  Inference types by region:")
-        for region in sorted(regions):
+        out.append(f"  Inference types by region:")
+        for region in regions:
             inference_types = data['inference_types'].get(region, [])
-            print(f"    {region}: {', '.join(inference_types)}")
+            out.append(f"    {region}: {', '.join(inference_types)}")
+
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 def merge_failed_regions_from_previous(
@@ -643,47 +725,43 @@ def merge_failed_regions_from_previous(
 
             if model_id not in sorted_mapping:
                 print(f"  Restoring model {model_id} from old state because region {region} failed")
-                import copy
-                sorted_mapping[model_id] = copy.deepcopy(old_entry)
+                sorted_mapping[model_id] = _frozen(old_entry)
                 continue
 
             entry = sorted_mapping[model_id]
 
             if was_in_regions and region not in entry['regions']:
                 print(f"  Restoring region {region} for model {model_id}")
-                entry['regions'].append(region)
-                entry['regions'].sort()
+                entry['regions'] = tuple(sorted((*entry['regions'], region)))
 
             if was_in_inf_types:
                 if region not in entry['inference_types']:
                     print(f"  Restoring inference_types for region {region} on model {model_id}")
-                    entry['inference_types'][region] = sorted(old_inf_types[region])
+                    entry['inference_types'][region] = tuple(sorted(old_inf_types[region]))
                 else:
                     current_types = set(entry['inference_types'][region])
                     missing_types = set(old_inf_types[region]) - current_types
                     if missing_types:
-                        print(f"  Restoring missing inference_types {sorted(list(missing_types))} for region {region} on model {model_id}")
+                        print(f"  Restoring missing inference_types {sorted(missing_types)} for region {region} on model {model_id}")
                         current_types.update(missing_types)
-                        entry['inference_types'][region] = sorted(list(current_types))
+                        entry['inference_types'][region] = tuple(sorted(current_types))
 
             if was_in_mantle:
-                if 'mantle_supported_regions' not in entry:
-                    entry['mantle_supported_regions'] = []
-                if region not in entry['mantle_supported_regions']:
+                mantle_regions = entry.get('mantle_supported_regions', ())
+                if region not in mantle_regions:
                     print(f"  Restoring mantle_supported_regions {region} for model {model_id}")
-                    entry['mantle_supported_regions'].append(region)
-                    entry['mantle_supported_regions'].sort()
+                    entry['mantle_supported_regions'] = tuple(sorted((*mantle_regions, region)))
 
                 old_mantle_apis = old_entry.get('mantle_apis', [])
                 if old_mantle_apis:
                     if 'mantle_apis' not in entry:
-                        entry['mantle_apis'] = sorted(old_mantle_apis)
+                        entry['mantle_apis'] = tuple(sorted(old_mantle_apis))
                     else:
                         current_apis = set(entry['mantle_apis'])
                         missing_apis = set(old_mantle_apis) - current_apis
                         if missing_apis:
                             current_apis.update(missing_apis)
-                            entry['mantle_apis'] = sorted(list(current_apis))
+                            entry['mantle_apis'] = tuple(sorted(current_apis))
 
             if has_profile_src:
                 if 'inferenceProfile' not in entry:
@@ -694,73 +772,93 @@ def merge_failed_regions_from_previous(
                             entry['inferenceProfile'][prefix] = {}
                         if region not in entry['inferenceProfile'][prefix]:
                             print(f"  Restoring inferenceProfile {prefix} for source region {region} on model {model_id}")
-                            entry['inferenceProfile'][prefix][region] = sorted(content[region])
+                            entry['inferenceProfile'][prefix][region] = tuple(sorted(content[region]))
 
-            if 'GLOBAL' in old_inf_profile and isinstance(old_inf_profile['GLOBAL'], list):
+            if 'GLOBAL' in old_inf_profile and isinstance(old_inf_profile['GLOBAL'], (list, tuple)):
                 if region in old_inf_profile['GLOBAL']:
                     if 'inferenceProfile' not in entry:
                         entry['inferenceProfile'] = {}
-                    if 'GLOBAL' not in entry['inferenceProfile']:
-                        entry['inferenceProfile']['GLOBAL'] = [region]
-                    elif region not in entry['inferenceProfile']['GLOBAL']:
-                        entry['inferenceProfile']['GLOBAL'].append(region)
-                        entry['inferenceProfile']['GLOBAL'].sort()
+                    global_regions = entry['inferenceProfile'].get('GLOBAL', ())
+                    if region not in global_regions:
+                        entry['inferenceProfile']['GLOBAL'] = tuple(sorted((*global_regions, region)))
+
+
+def _write_json(data: Dict[str, Any], filename: str) -> None:
+    """Write data as indented, key-sorted JSON, using orjson when it is installed."""
+    if orjson is not None:
+        # Same bytes as json.dump(indent=2, sort_keys=True) for this ASCII-only data
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    else:
+        with open(filename, 'w') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+
+
+def _frozen(value: Any) -> Any:
+    """Return a copy of a JSON value with every list turned into a tuple."""
+    if isinstance(value, dict):
+        return {key: _frozen(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen(item) for item in value)
+    return value
+
+
+def _sorted_entry(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the finished form of a model entry: dicts in sorted order, lists sorted into tuples."""
+    entry = {
+        'regions': tuple(sorted(data['regions'])),
+        'inference_types': {region: tuple(sorted(types)) for region, types in sorted(data['inference_types'].items())},
+        'model_lifecycle_status': data.get('model_lifecycle_status', 'ACTIVE'),
+        'inputModalities': tuple(sorted(data.get('inputModalities', set()))),
+        'outputModalities': tuple(sorted(data.get('outputModalities', set()))),
+        'responseStreamingSupported': data.get('responseStreamingSupported', False),
+        'customizationsSupported': tuple(sorted(data.get('customizationsSupported', set())))
+    }
+    
+    # Add runtime support if applicable
+    if data.get('runtime_supported'):
+        entry['runtime_supported'] = True
+
+    # Add inferenceProfile if it exists and is not empty
+    if data.get('inferenceProfile'):
+        entry['inferenceProfile'] = {}
+        for prefix, content in sorted(data['inferenceProfile'].items()):
+            if prefix == 'GLOBAL':
+                entry['inferenceProfile'][prefix] = tuple(sorted(content))
+            else:
+                entry['inferenceProfile'][prefix] = {
+                    src: tuple(sorted(tgts)) for src, tgts in sorted(content.items())
+                }
+                
+    # Add mantle fields if supported
+    if data.get('mantle_supported_regions'):
+        entry['mantle_supported_regions'] = tuple(sorted(data['mantle_supported_regions']))
+        entry['mantle_apis'] = tuple(sorted(data['mantle_apis']))
+    return entry
 
 
 def save_to_json(model_mapping: Dict[str, Any], filename: str = '../shared/bedrock_models.json', failed_regions: Set[str] | None = None):
-    """Save the model mapping to a JSON file with sorted keys and values for deterministic output."""
+    """
+    Save the model mapping to a JSON file, along with its change metadata.
+
+    The mapping is written as given: entries are expected in the finished form
+    scan_all_regions_parallel returns. Entries of failed regions are patched in place.
+    """
     import os
     from datetime import datetime, timezone
 
-    # Sort regions and inference_types lists for deterministic output
-    sorted_mapping = {}
-    for model_id in sorted(model_mapping.keys()):
-        data = model_mapping[model_id]
-        
-        entry = {
-            'regions': sorted(data['regions']),
-            'inference_types': {region: sorted(types) for region, types in sorted(data['inference_types'].items())},
-            'model_lifecycle_status': data.get('model_lifecycle_status', 'ACTIVE'),
-            'inputModalities': sorted(list(data.get('inputModalities', set()))),
-            'outputModalities': sorted(list(data.get('outputModalities', set()))),
-            'responseStreamingSupported': data.get('responseStreamingSupported', False),
-            'customizationsSupported': sorted(list(data.get('customizationsSupported', set())))
-        }
-        
-        # Add runtime support if applicable
-        if data.get('runtime_supported'):
-            entry['runtime_supported'] = True
-
-        # Add inferenceProfile if it exists and is not empty
-        if data.get('inferenceProfile'):
-            entry['inferenceProfile'] = {}
-            for prefix, content in sorted(data['inferenceProfile'].items()):
-                if prefix == 'GLOBAL':
-                    entry['inferenceProfile'][prefix] = sorted(content)
-                else:
-                    entry['inferenceProfile'][prefix] = {
-                        src: sorted(tgts) for src, tgts in sorted(content.items())
-                    }
-                    
-        # Add mantle fields if supported
-        if data.get('mantle_supported_regions'):
-            entry['mantle_supported_regions'] = sorted(data['mantle_supported_regions'])
-            entry['mantle_apis'] = sorted(data['mantle_apis'])
-            
-        sorted_mapping[model_id] = entry
-    
-    # Load old model definitions to compare
+    # Load old model definitions to compare, frozen like the new entries
     old_models = {}
     if os.path.exists(filename):
         try:
             with open(filename, 'r') as f:
-                old_models = json.load(f)
+                old_models = _frozen(json.load(f))
         except Exception as e:
             print(f"Warning: Could not load existing models file: {e}")
 
     # Preserve previous state for failed regions
     if failed_regions and old_models:
-        merge_failed_regions_from_previous(sorted_mapping, failed_regions, old_models)
+        merge_failed_regions_from_previous(model_mapping, failed_regions, old_models)
 
     # Load existing metadata
     metadata_filename = os.path.join(os.path.dirname(filename), 'bedrock_models_metadata.json')
@@ -776,12 +874,12 @@ def save_to_json(model_mapping: Dict[str, Any], filename: str = '../shared/bedro
     new_metadata = {}
 
     # 1. Process all active models in the new mapping
-    for model_id, entry in sorted_mapping.items():
+    for model_id, entry in model_mapping.items():
         old_entry = old_models.get(model_id)
         existing_meta = old_metadata.get(model_id, {})
         
         # Check if the model is new OR its definition has changed
-        if old_entry is None or entry != old_entry:
+        if old_entry is None or _frozen(entry) != old_entry:
             new_metadata[model_id] = {
                 'last_changed': current_date
             }
@@ -794,7 +892,7 @@ def save_to_json(model_mapping: Dict[str, Any], filename: str = '../shared/bedro
 
     # 2. Process models that were in the old models OR old metadata but are not in the new mapping
     all_past_model_ids = set(old_models.keys()) | set(old_metadata.keys())
-    deleted_model_ids = all_past_model_ids - set(sorted_mapping.keys())
+    deleted_model_ids = all_past_model_ids - set(model_mapping.keys())
     
     for model_id in sorted(deleted_model_ids):
         existing_meta = old_metadata.get(model_id, {})
@@ -810,23 +908,29 @@ def save_to_json(model_mapping: Dict[str, Any], filename: str = '../shared/bedro
             'deleted': deleted_date
         }
 
-    # Write bedrock_models.json
-    with open(filename, 'w') as f:
-        json.dump(sorted_mapping, f, indent=2, sort_keys=True)
+    # Write bedrock_models.json. Keys stay sorted on write: merge_failed_regions_from_previous
+    # adds restored regions to existing dicts, so insertion order isn't sorted
+    _write_json(model_mapping, filename)
     print(f"\n\nResults saved to {filename}")
 
     # Write bedrock_models_metadata.json
-    with open(metadata_filename, 'w') as f:
-        json.dump(new_metadata, f, indent=2, sort_keys=True)
+    _write_json(new_metadata, metadata_filename)
     print(f"Metadata saved to {metadata_filename}")
 
 
 def main():
     """Main function to scan regions and generate model mapping."""
+    parser = argparse.ArgumentParser(description="Scan AWS regions for Bedrock foundation models.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Also log per-model details, such as excluded models")
+    args = parser.parse_args()
+
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s %(levelname)s %(message)s',
     )
+    if args.verbose:
+        # Only this script's logger: botocore's DEBUG output would drown it out
+        logger.setLevel(logging.DEBUG)
     print("AWS Bedrock Foundation Model Scanner (Parallel)")
     print("="*80 + "\n")
     
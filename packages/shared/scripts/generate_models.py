@@ -4,48 +4,80 @@ Script to generate model constants for both Python and TypeScript from bedrock_m
 """
 
 import json
-import re
 import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_TRANS = str.maketrans('.-', '__')
+_CONTEXT_UNITS = frozenset('kmg')
+
+def _strip_number(s: str, prefix: str) -> str:
+    """
+    Strip prefix followed by one or more trailing digits from s, if present.
+    """
+    i = len(s)
+    while i and s[i - 1].isdecimal():
+        i -= 1
+    if i < len(s) and s.endswith(prefix, 0, i):
+        return s[:i - len(prefix)]
+    return s
+
 def model_id_to_field_name(model_id: str) -> str:
     """
     Convert a model ID to a constant name.
     """
+    # Context size suffix, e.g. ":200k" or ":mm"
     context_suffix = ''
-    context_match = re.search(r':(\d+[kmg]|mm)$', model_id, re.IGNORECASE)
-    if context_match:
-        context_suffix = '_' + context_match.group(1).upper()
-        model_id = model_id[:context_match.start()]
-    
-    name = re.sub(r'-v?\d+:\d+$', '', model_id)
-    name = re.sub(r':\d+$', '', name)
-    name = re.sub(r'-v\d+$', '', name)
+    head, sep, tail = model_id.rpartition(':')
+    if sep:
+        lower = tail.lower()
+        if lower == 'mm' or (lower[-1:] in _CONTEXT_UNITS and tail[:-1].isdecimal()):
+            context_suffix = '_' + tail.upper()
+            model_id = head
     
-    name = name.replace('.', '_').replace('-', '_')
-    name = name.upper() + context_suffix
+    # Version suffixes, peeled right to left: a "-v1:0" tail, then ":0", then "-v1"
+    name = _strip_number(model_id, ':')
+    if len(name) < len(model_id):
+        base = _strip_number(name, '-v')
+        if len(base) == len(name):
+            base = _strip_number(name, '-')
+        if len(base) < len(name):
+            name = _strip_number(base, ':')
+    name = _strip_number(name, '-v')
     
-    return name
+    return name.translate(_TRANS).upper() + context_suffix
 
-def collect_models(model_mapping, filter_fn=None):
-    legacy_models = {}
-    active_models = {}
+def collect_models(model_mapping, class_filters):
+    """
+    Partition the models into (active, legacy) field maps for each class.
+
+    class_filters maps a class name to a predicate on the model data, or None
+    to keep every model. The mapping is walked once, so each model's field
+    name is computed once however many classes include it.
+    """
+    classes = {class_name: ({}, {}) for class_name in class_filters}
     
     # Sort keys to ensure consistent selection of "latest" version if duplicates exist
     for model_id in sorted(model_mapping.keys()):
         model_data = model_mapping[model_id]
-        if filter_fn and not filter_fn(model_data):
-            continue
         lifecycle_status = model_data.get('model_lifecycle_status', 'ACTIVE')
         field_name = model_id_to_field_name(model_id)
         
-        if lifecycle_status == 'LEGACY':
-            # Use a dict to deduplicate by field name
-            legacy_models[field_name] = model_id
-        else:
-            active_models[field_name] = model_id
+        for class_name, filter_fn in class_filters.items():
+            if filter_fn and not filter_fn(model_data):
+                continue
+            active_models, legacy_models = classes[class_name]
+            if lifecycle_status == 'LEGACY':
+                # Use a dict to deduplicate by field name
+                legacy_models[field_name] = model_id
+            else:
+                active_models[field_name] = model_id
             
-    return active_models, legacy_models
+    return classes
 
 def generate_python(classes_to_generate, output_file, stub_file):
     lines = [
@@ -53,75 +85,237 @@ def generate_python(classes_to_generate, output_file, stub_file):
         'Auto-generated class containing AWS Bedrock Foundation Model IDs.',
         '"""',
         '',
-        'import warnings',
-        'from .utils import cris_model_id, global_model_id',
+        'import functools',
+        'import sys',
+        'from typing import Optional',
+        'from . import utils',
+        'from .utils import cris_model_id, get_available_regions, global_model_id, resolve_endpoint',
+        '',
+        '',
+        '@functools.lru_cache(maxsize=4096)',
+        'def _cris_cached(model_id: str, region: str) -> str:',
+        '    return cris_model_id(model_id, region)',
+        '',
+        '',
+        '@functools.lru_cache(maxsize=4096)',
+        'def _global_cris_cached(model_id: str, region: str) -> str:',
+        '    return global_model_id(model_id, region)',
         '',
         '',
+        '@functools.lru_cache(maxsize=4096)',
+        'def _regions_cached(model_id: str) -> tuple[str, ...]:',
+        '    return tuple(sorted(get_available_regions(model_id)))',
+        '',
+        '',
+        'def clear_caches() -> None:',
+        '    """Clear the memoized model data and CRIS, global inference profile and region lookups."""',
+        '    utils.clear_caches()',
+        '    _cris_cached.cache_clear()',
+        '    _global_cris_cached.cache_clear()',
+        '    _regions_cached.cache_clear()',
+        '',
+        '',
+        '_DEPRECATED_MESSAGE = (',
+        '    "Model \'{model_id}\' has LEGACY status and may be removed by AWS. "',
+        '    "Consider migrating to a newer model."',
+        ')',
+        '',
         'class BedrockModel(str):',
         '    """Specialized string type that adds Bedrock-specific methods."""',
         '',
-        '    def cris(self, region: str = None) -> str:',
+        '    # _sid holds the interned plain-str form of the ID, so lookups in the',
+        '    # model data dicts take the exact-str fast path.',
+        '    __slots__ = ("_sid",)',
+        '    _intern: dict[str, "BedrockModel"] = {}',
+        '',
+        '    def __new__(cls, value: str) -> "BedrockModel":',
+        '        model = cls._intern.get(value)',
+        '        if model is not None:',
+        '            return model',
+        '        sid = sys.intern(str(value))',
+        '        model = super().__new__(cls, sid)',
+        '        model._sid = sid',
+        '        cls._intern[sid] = model',
+        '        return model',
+        '',
+        '    def __reduce__(self) -> tuple:',
+        '        return (BedrockModel, (self._sid,))',
+        '',
+        '    def cris(self, region: Optional[str] = None) -> str:',
         '        """Get the cross-region inference (CRIS) model ID for this model."""',
-        '        return cris_model_id(str(self), region)',
+        '        if region is None:',
+        '            return cris_model_id(self._sid, region)',
+        '        return _cris_cached(self._sid, region)',
         '',
-        '    def global_cris(self, region: str = None) -> str:',
+        '    def global_cris(self, region: Optional[str] = None) -> str:',
         '        """Get the global inference profile ID for this model."""',
-        '        return global_model_id(str(self), region)',
-        '',
-        '',
-        'class _DeprecatedModelDescriptor:',
-        '    """Descriptor that emits deprecation warning when accessed."""',
-        '    def __init__(self, model_id: str, message: str):',
-        '        self.model_id = BedrockModel(model_id)',
-        '        self.message = message',
-        '    def __get__(self, obj, objtype=None):',
-        '        warnings.warn(self.message, DeprecationWarning, stacklevel=2)',
-        '        return self.model_id',
-        '    def __set_name__(self, owner, name):',
-        '        self.name = name',
+        '        if region is None:',
+        '            return global_model_id(self._sid, region)',
+        '        return _global_cris_cached(self._sid, region)',
+        '',
+        '    def resolve(self, region: Optional[str] = None, prefer_global: bool = False) -> tuple[str, str]:',
+        '        """Resolve the best endpoint ID and its kind for this model in a region."""',
+        '        return resolve_endpoint(self._sid, region, prefer_global)',
+        '',
+        '    @property',
+        '    def available_regions(self) -> tuple[str, ...]:',
+        '        """Sorted regions where this model is available, computed once per model."""',
+        '        return _regions_cached(self._sid)',
+        '',
+        '',
+        'def _deprecated_model(model_id: str) -> BedrockModel:',
+        '    """Warn that a LEGACY model was accessed, then return it."""',
+        '    import warnings',
+        '',
+        '    # stacklevel=3 skips this helper and the __getattr__ calling it',
+        '    message = _DEPRECATED_MESSAGE.format(model_id=model_id)',
+        '    warnings.warn(message, DeprecationWarning, stacklevel=3)',
+        '    return BedrockModel(model_id)',
+        '',
+        '',
+        'class _ModelsMeta(type):',
+        '    """',
+        '    Metaclass building the model constants of a class from its _TABLE string.',
+        '',
+        '    Each whitespace-separated row is NAME=model_id; a leading "!" marks a LEGACY model.',
+        '',
+        '    Constants are built by __getattr__ on first access. Active ones are then',
+        '    stored on the class, so later reads are plain attribute loads; deprecated',
+        '    ones are never stored and emit a DeprecationWarning on every access',
+        '    (shown once per location under the default warnings filters).',
+        '    """',
+        '',
+        '    def __new__(mcs, name, bases, namespace):',
+        '        index = {}',
+        '        deprecated = {}',
+        '        for row in namespace.pop("_TABLE", "").split():',
+        '            field, _, model_id = row.lstrip("!").partition("=")',
+        '            index[field] = model_id',
+        '            if row[0] == "!":',
+        '                deprecated[field] = model_id',
+        '        namespace["_INDEX"] = index',
+        '        namespace["_DEPRECATED"] = deprecated',
+        '        namespace["_DEPRECATED_IDS"] = frozenset(deprecated.values())',
+        '        return super().__new__(mcs, name, bases, namespace)',
+        '',
+        '    def __getattr__(cls, name):',
+        '        model_id = cls._DEPRECATED.get(name)',
+        '        if model_id is not None:',
+        '            return _deprecated_model(model_id)',
+        '        model_id = cls._INDEX.get(name)',
+        '        if model_id is None:',
+        '            raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}")',
+        '        model = BedrockModel(model_id)',
+        '        type.__setattr__(cls, name, model)',
+        '        return model',
+        '',
+        '    def __iter__(cls):',
+        '        return iter(cls._INDEX)',
+        '',
+        '    def __dir__(cls):',
+        '        return sorted(set(super().__dir__()) | set(cls._INDEX))',
+        '',
+        '    def is_deprecated(cls, model_id: str) -> bool:',
+        '        """Check whether a model ID has LEGACY status, without triggering a warning."""',
+        '        return model_id in cls._DEPRECATED_IDS',
+        '',
+        '    def as_str(cls, model: str) -> str:',
+        '        """Return a model ID as a plain str, for code that requires exactly str."""',
+        '        if isinstance(model, BedrockModel):',
+        '            return model._sid',
+        '        return str.__str__(model)',
     ]
     
-    for class_name, (active_models, legacy_models) in classes_to_generate.items():
-        lines.extend([
-            '',
-            '',
-            f'class {class_name}:',
-            f'    """Static class containing Bedrock foundation model IDs as constants for {class_name}."""',
-            ''
-        ])
-        for field_name in sorted(active_models.keys()):
-            lines.append(f'    {field_name} = BedrockModel("{active_models[field_name]}")')
-        
-        for field_name in sorted(legacy_models.keys()):
-            model_id = legacy_models[field_name]
-            msg = f"Model '{model_id}' has LEGACY status and may be removed by AWS. Consider migrating to a newer model."
-            lines.append(f'    {field_name} = _DeprecatedModelDescriptor("{model_id}", "{msg}")')
-        
+    module_getattr = [
+        'def __getattr__(name: str) -> BedrockModel:',
+        '    """',
+        '    Expose Models constants as module attributes (PEP 562).',
+        '',
+        '    Active constants are cached in the module globals, so later accesses are',
+        '    plain dict hits; deprecated ones warn on every access, like Models.',
+        '    """',
+        '    if name not in Models._INDEX:',
+        '        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")',
+        '    model_id = Models._DEPRECATED.get(name)',
+        '    if model_id is not None:',
+        '        return _deprecated_model(model_id)',
+        '    model = globals()[name] = getattr(Models, name)',
+        '    return model',
+    ]
+
+    # Sort each class's fields once; the module and the stub share the order
+    sorted_fields = {
+        class_name: (sorted(active_models), sorted(legacy_models))
+        for class_name, (active_models, legacy_models) in classes_to_generate.items()
+    }
+
+    # Model rows are streamed to the file rather than collected and joined
     with open(output_file, 'w') as f:
         f.write('\n'.join(lines) + '\n')
+        for class_name, (active_models, legacy_models) in classes_to_generate.items():
+            active_fields, legacy_fields = sorted_fields[class_name]
+            f.write(
+                '\n\n'
+                f'class {class_name}(metaclass=_ModelsMeta):\n'
+                f'    """Static class containing Bedrock foundation model IDs as constants for {class_name}."""\n'
+                '\n'
+                '    _TABLE = """\n'
+            )
+            f.writelines(
+                f'        {field_name}={active_models[field_name]}\n'
+                for field_name in active_fields
+            )
+            f.writelines(
+                f'        !{field_name}={legacy_models[field_name]}\n'
+                for field_name in legacy_fields
+            )
+            f.write('    """\n')
+        f.write('\n\n' + '\n'.join(module_getattr) + '\n')
         
     stub_lines = [
-        'from typing import Final, Optional',
+        'from typing import Final, Iterator, Optional',
         '',
         'class BedrockModel(str):',
         '    def cris(self, region: Optional[str] = None) -> str: ...',
         '    def global_cris(self, region: Optional[str] = None) -> str: ...',
+        '    def resolve(self, region: Optional[str] = None, prefer_global: bool = False) -> tuple[str, str]: ...',
+        '    @property',
+        '    def available_regions(self) -> tuple[str, ...]: ...',
+        '',
+        'class _ModelsMeta(type):',
+        '    def __iter__(cls) -> Iterator[str]: ...',
+        '    def is_deprecated(cls, model_id: str) -> bool: ...',
+        '    def as_str(cls, model: str) -> str: ...',
+        '',
+        'def clear_caches() -> None: ...',
     ]
     
-    for class_name, (active_models, legacy_models) in classes_to_generate.items():
-        stub_lines.extend([
-            '',
-            f'class {class_name}:',
-            ''
-        ])
-        for field_name in sorted(active_models.keys()):
-            stub_lines.append(f'    {field_name}: Final[BedrockModel]')
-        for field_name in sorted(legacy_models.keys()):
-            model_id = legacy_models[field_name]
-            stub_lines.append(f'    {field_name}: Final[BedrockModel]  # deprecated: Model \'{model_id}\' has LEGACY status')
-            
     with open(stub_file, 'w') as f:
         f.write('\n'.join(stub_lines) + '\n')
+        for class_name, (active_models, legacy_models) in classes_to_generate.items():
+            active_fields, legacy_fields = sorted_fields[class_name]
+            f.write(f'\nclass {class_name}(metaclass=_ModelsMeta):\n\n')
+            f.writelines(
+                f'    {field_name}: Final[BedrockModel]\n'
+                for field_name in active_fields
+            )
+            f.writelines(
+                f'    {field_name}: Final[BedrockModel]  # deprecated: Model \'{legacy_models[field_name]}\' has LEGACY status\n'
+                for field_name in legacy_fields
+            )
+
+        # The module-level __getattr__ serves the Models constants; they are
+        # declared one by one so type checkers still flag unknown names
+        active_fields, legacy_fields = sorted_fields['Models']
+        f.write('\n# Models constants, also available as module attributes\n')
+        f.writelines(
+            f'{field_name}: Final[BedrockModel]\n'
+            for field_name in active_fields
+        )
+        f.writelines(
+            f'{field_name}: Final[BedrockModel]  # deprecated\n'
+            for field_name in legacy_fields
+        )
 
 def generate_typescript(classes_to_generate, output_file):
     lines = [
@@ -152,25 +346,22 @@ def generate_typescript(classes_to_generate, output_file):
         ''
     ]
     
-    for class_name, (active_models, legacy_models) in classes_to_generate.items():
-        lines.extend([
-            '/**',
-            f' * Model IDs for {class_name}.',
-            ' */',
-            f'export const {class_name} = {{'
-        ])
-        # Combined sorted field names to maintain one sort order
-        all_fields = sorted(set(active_models.keys()) | set(legacy_models.keys()))
-        for field_name in all_fields:
-            model_id = active_models.get(field_name) or legacy_models.get(field_name)
-            lines.append(f"  {field_name}: new BedrockModel('{model_id}'),")
-        lines.extend([
-            '};',
-            ''
-        ])
-    
     with open(output_file, 'w') as f:
         f.write('\n'.join(lines) + '\n')
+        for class_name, (active_models, legacy_models) in classes_to_generate.items():
+            f.write(
+                '/**\n'
+                f' * Model IDs for {class_name}.\n'
+                ' */\n'
+                f'export const {class_name} = {{\n'
+            )
+            # Combined sorted field names to maintain one sort order; active IDs win
+            all_models = {**legacy_models, **active_models}
+            f.writelines(
+                f"  {field_name}: new BedrockModel('{all_models[field_name]}'),\n"
+                for field_name in sorted(all_models)
+            )
+            f.write('};\n\n')
 
 def main():
     # Base directory is the repo root
@@ -181,28 +372,20 @@ def main():
     py_stub = root / 'packages/python/bedrock_models/bedrock_model_ids.pyi'
     ts_output = root / 'packages/typescript/src/models.ts'
     
-    with open(json_path, 'r') as f:
-        model_mapping = json.load(f)
+    if orjson is not None:
+        with open(json_path, 'rb') as f:
+            model_mapping = orjson.loads(f.read())
+    else:
+        with open(json_path, 'r') as f:
+            model_mapping = json.load(f)
         
-    active_models, legacy_models = collect_models(model_mapping)
-    
-    # Filter for Mantle Models: mantle_supported_regions must be non-empty list/array
-    mantle_active, mantle_legacy = collect_models(
-        model_mapping,
-        filter_fn=lambda data: bool(data.get('mantle_supported_regions'))
-    )
-    
-    # Filter for Runtime Models: runtime_supported must be True
-    runtime_active, runtime_legacy = collect_models(
-        model_mapping,
-        filter_fn=lambda data: bool(data.get('runtime_supported'))
-    )
-    
-    classes_to_generate = {
-        'Models': (active_models, legacy_models),
-        'MantleModels': (mantle_active, mantle_legacy),
-        'RuntimeModels': (runtime_active, runtime_legacy)
-    }
+    classes_to_generate = collect_models(model_mapping, {
+        'Models': None,
+        # Mantle Models: mantle_supported_regions must be non-empty list/array
+        'MantleModels': lambda data: bool(data.get('mantle_supported_regions')),
+        # Runtime Models: runtime_supported must be True
+        'RuntimeModels': lambda data: bool(data.get('runtime_supported')),
+    })
     
     print(f"Generating Python files...")
     generate_python(classes_to_generate, py_output, py_stub)